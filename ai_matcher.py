@@ -1,25 +1,74 @@
+import functools
+import os
 import re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-import nltk
-
-# Ensure NLTK stop words are downloaded
-try:
-    stopwords.words('english')
-except LookupError:
-    nltk.download('punkt')
-    nltk.download('stopwords')
+import numpy as np
+
+# sklearn, joblib and nltk are imported lazily inside the functions that need them,
+# so importing this module stays cheap for callers that never match or analyze text.
+
+_CLEAN_RE = re.compile(r'[^a-z\s]')  # Punctuation and numbers
+_TOKEN_RE = re.compile(r'[a-z]+')
+
+# Lowercasing, tokenization and stop word removal are delegated to the vectorizer itself
+_VECTORIZER_OPTIONS = {
+    "lowercase": True,
+    "token_pattern": r"(?u)\b[a-z]{2,}\b",
+    "stop_words": 'english',
+    "sublinear_tf": True,
+    "norm": 'l2',
+    "dtype": np.float32,  # Half the memory of float64 and single-precision BLAS kernels
+}
+
+# Jobs sharing less than this fraction of the profile's words are scored 0 without TF-IDF.
+# The overlap is relative to the profile alone, so long job descriptions aren't penalized for their length.
+PROFILE_OVERLAP_THRESHOLD = 0.05
+
+# Path of the corpus-wide TF-IDF model, fitted once by fit_corpus_vectorizer
+TFIDF_MODEL_PATH = os.getenv("TFIDF_MODEL_PATH", os.path.join("cache", "tfidf.joblib"))
+
+_VECTORIZER = None
+_vectorizer_loaded = False
+
+@functools.cache
+def get_stopwords():
+    """
+    Returns the NLTK English stop words as a frozenset, downloading them on first use if needed.
+    """
+    import nltk
+    from nltk.corpus import stopwords
+
+    try:
+        words = stopwords.words('english')
+    except LookupError:
+        nltk.download('stopwords')
+        words = stopwords.words('english')
+    return frozenset(words)
+
+def _get_corpus_vectorizer():
+    """
+    Returns the pre-fit corpus vectorizer, loading it from TFIDF_MODEL_PATH on first use.
+    Returns None when no model has been fitted yet, in which case vectorizers are fitted per call.
+    """
+    global _VECTORIZER, _vectorizer_loaded
+    if not _vectorizer_loaded:
+        import joblib
+
+        try:
+            _VECTORIZER = joblib.load(TFIDF_MODEL_PATH)
+        except FileNotFoundError:
+            _VECTORIZER = None
+        _vectorizer_loaded = True
+    return _VECTORIZER
 
 def preprocess_text(text):
     """
     A helper function to clean and tokenize text (e.g., lowercase, remove punctuation, stop words).
+    The matching functions no longer use it (the vectorizer does this work); it is kept for
+    keyword analysis such as market_analyzer.
     """
-    text = text.lower()
-    text = re.sub(r'[^a-z\s]', '', text)  # Remove punctuation and numbers
-    tokens = word_tokenize(text)
-    stop_words = set(stopwords.words('english'))
+    stop_words = get_stopwords()
+    text = _CLEAN_RE.sub('', text.lower())
+    tokens = _TOKEN_RE.findall(text)
     filtered_tokens = [word for word in tokens if word not in stop_words]
     return " ".join(filtered_tokens)
 
@@ -27,14 +76,37 @@ def generate_tfidf_vectors(documents):
     """
     Takes a list of text documents and generates TF-IDF vectors.
     """
-    vectorizer = TfidfVectorizer()
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    vectorizer = TfidfVectorizer(**_VECTORIZER_OPTIONS)
     tfidf_matrix = vectorizer.fit_transform(documents)
     return tfidf_matrix, vectorizer
 
+def fit_corpus_vectorizer(job_texts):
+    """
+    Fits a TF-IDF vectorizer on the whole jobs corpus and persists it to TFIDF_MODEL_PATH.
+    Subsequent matches only transform their texts with this model instead of refitting.
+    """
+    global _VECTORIZER, _vectorizer_loaded
+    import joblib
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    vectorizer = TfidfVectorizer(max_features=10000, **_VECTORIZER_OPTIONS)
+    vectorizer.fit(job_texts)
+    os.makedirs(os.path.dirname(TFIDF_MODEL_PATH) or ".", exist_ok=True)
+    joblib.dump(vectorizer, TFIDF_MODEL_PATH)
+    _VECTORIZER = vectorizer
+    _vectorizer_loaded = True
+    _score_cached.cache_clear()  # Cached scores were computed with the previous model
+    _profile_features.cache_clear()
+    return vectorizer
+
 def calculate_similarity(vector1, vector2):
     """
     Takes two TF-IDF vectors and calculates their cosine similarity.
     """
+    from sklearn.metrics.pairwise import cosine_similarity
+
     # Reshape vectors for cosine_similarity if they are single samples
     if vector1.ndim == 1:
         vector1 = vector1.reshape(1, -1)
@@ -43,26 +115,92 @@ def calculate_similarity(vector1, vector2):
     
     return cosine_similarity(vector1, vector2)[0][0]
 
-def match_job_to_user(job_description, user_profile_text):
+@functools.cache
+def _analyzer():
+    """
+    The vectorizer's own analyzer (lowercasing, token pattern and stop words of _VECTORIZER_OPTIONS),
+    built once, so the overlap prefilter sees exactly the tokens the TF-IDF scoring sees.
     """
-    This main function should:
-    *   Take a job_description (string) and user_profile_text (string) as input.
-    *   Preprocess both texts.
-    *   Generate TF-IDF vectors for both texts.
-    *   Calculate the cosine similarity between the two vectors.
-    *   Return the similarity score (a float between 0 and 1).
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    return TfidfVectorizer(**_VECTORIZER_OPTIONS).build_analyzer()
+
+def _token_set(text):
+    """
+    Cheap set of content words used by the overlap prefilter.
+    """
+    return set(_analyzer()(text))
+
+@functools.lru_cache(maxsize=32)
+def _profile_features(user_profile_text):
+    """
+    Token set and, when a corpus vectorizer exists, TF-IDF vector of a user profile.
+    Computed once per profile text, so scoring several batches of jobs for the same
+    user doesn't tokenize and vectorize the profile again each time.
+    """
+    corpus_vectorizer = _get_corpus_vectorizer()
+    user_vector = corpus_vectorizer.transform([user_profile_text]) if corpus_vectorizer is not None else None
+    return frozenset(_token_set(user_profile_text)), user_vector
+
+def _overlaps_profile(user_tokens, job_tokens):
+    """
+    Whether a job shares at least one word, and at least PROFILE_OVERLAP_THRESHOLD
+    of the profile's words, with the profile (shared words / profile words).
+    """
+    shared = len(user_tokens & job_tokens)
+    return shared > 0 and shared >= PROFILE_OVERLAP_THRESHOLD * len(user_tokens)
+
+def match_user_to_jobs(user_profile_text, job_descriptions):
     """
-    preprocessed_job = preprocess_text(job_description)
-    preprocessed_user = preprocess_text(user_profile_text)
+    Scores a user profile against a list of job descriptions in a single pass.
+    Jobs covering less than PROFILE_OVERLAP_THRESHOLD of the profile's words
+    score 0 without being vectorized. The remaining texts are transformed with the pre-fit
+    corpus vectorizer when available (otherwise one vectorizer is fitted on them), then
+    every cosine similarity is computed with one sparse matrix product.
+    Returns a numpy array with one similarity score (between 0 and 1) per job description.
+    """
+    scores = np.zeros(len(job_descriptions), dtype=np.float32)
+
+    user_tokens, user_vector = _profile_features(user_profile_text)
+    candidates = []
+    for index, description in enumerate(job_descriptions):
+        if _overlaps_profile(user_tokens, _token_set(description)):
+            candidates.append(index)
+
+    if not candidates:
+        return scores
 
-    documents = [preprocessed_job, preprocessed_user]
-    tfidf_matrix, vectorizer = generate_tfidf_vectors(documents)
+    from sklearn.metrics.pairwise import cosine_similarity
 
-    job_vector = tfidf_matrix[0]
-    user_vector = tfidf_matrix[1]
+    candidate_descriptions = [job_descriptions[index] for index in candidates]
 
-    similarity_score = calculate_similarity(job_vector, user_vector)
-    return similarity_score
+    corpus_vectorizer = _get_corpus_vectorizer()
+    if corpus_vectorizer is not None:
+        # The profile vector comes from the cache; only the job descriptions are transformed
+        job_vectors = corpus_vectorizer.transform(candidate_descriptions)
+    else:
+        tfidf_matrix, _ = generate_tfidf_vectors([user_profile_text] + candidate_descriptions)
+        user_vector = tfidf_matrix[0]
+        job_vectors = tfidf_matrix[1:]
+
+    scores[candidates] = cosine_similarity(user_vector, job_vectors)[0]
+    return scores
+
+@functools.lru_cache(maxsize=4096)
+def _score_cached(job_description, user_profile_text):
+    """
+    Memoized single-pair score. Scores are a pure function of the two texts,
+    so unchanged (job, user) pairs are never rescored.
+    """
+    return float(match_user_to_jobs(user_profile_text, [job_description])[0])
+
+def match_job_to_user(job_description, user_profile_text):
+    """
+    Takes a job_description (string) and user_profile_text (string) as input and
+    returns their similarity score (a float between 0 and 1).
+    Thin wrapper around match_user_to_jobs for a single job, memoized per text pair.
+    """
+    return _score_cached(job_description, user_profile_text)
 
 if __name__ == '__main__':
     # Example Usage
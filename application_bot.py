@@ -5,10 +5,45 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-async def submit_application(job_data: dict, user_profile: dict, cover_letter_text: str) -> bool:
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
+CV_PATH = os.getenv("CV_PATH", "path/to/your/cv.pdf") # Placeholder for now
+CV_EXISTS = os.path.exists(CV_PATH)
+
+# Form selectors
+NAME_SEL = "input[name*='name' i], input[id*='name' i]"
+EMAIL_SEL = "input[name*='email' i], input[id*='email' i]"
+PHONE_SEL = "input[name*='phone' i], input[id*='phone' i]"
+CV_SEL = "input[type='file' i]"
+LETTER_SEL = "textarea[name*='coverletter' i], textarea[id*='coverletter' i], textarea[name*='message' i], textarea[id*='message' i], textarea[aria-label*='cover letter' i]"
+SUBMIT_SEL = "button[type='submit' i], input[type='submit' i], button:has-text('Submit' i), button:has-text('Apply' i)"
+
+class ApplicationBot:
+    """
+    Submits applications through a single Playwright browser shared across submissions.
+    Each application gets its own browser context so cookies and storage stay isolated.
+
+    Usage:
+        async with ApplicationBot() as bot:
+            for job in jobs:
+                await bot.submit(job, user_profile, cover_letter_text)
+    """
+
+    def __init__(self, headless: bool = True):
+        self.headless = headless
+        self._playwright = None
+        self._browser = None
+
+    async def __aenter__(self):
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._browser.close()
+        await self._playwright.stop()
+
+    async def submit(self, job_data: dict, user_profile: dict, cover_letter_text: str) -> bool:
+        context = await self._browser.new_context()
+        page = await context.new_page()
 
         try:
             application_link = job_data.get("application_link")
@@ -19,37 +54,28 @@ async def submit_application(job_data: dict, user_profile: dict, cover_letter_te
             await page.goto(application_link)
             print(f"Navigated to: {application_link}")
 
-            # Fill out common fields
-            # Name
-            if user_profile.get("name"):
-                await page.fill("input[name*='name' i], input[id*='name' i]", user_profile["name"])
-                print(f"Filled name: {user_profile['name']}")
-
-            # Email
-            if user_profile.get("email"):
-                await page.fill("input[name*='email' i], input[id*='email' i]", user_profile["email"])
-                print(f"Filled email: {user_profile['email']}")
-
-            # Phone
-            if user_profile.get("phone"):
-                await page.fill("input[name*='phone' i], input[id*='phone' i]", user_profile["phone"])
-                print(f"Filled phone: {user_profile['phone']}")
+            # Fill out common fields one after another: a fill types into whichever element
+            # has focus, so concurrent fills on the same page could swap their values
+            fields = [
+                (NAME_SEL, user_profile.get("name")),   # Name
+                (EMAIL_SEL, user_profile.get("email")), # Email
+                (PHONE_SEL, user_profile.get("phone")), # Phone
+                (LETTER_SEL, cover_letter_text),        # Paste Cover Letter
+            ]
+            fills = [(selector, value) for selector, value in fields if value]
+            for selector, value in fills:
+                await page.fill(selector, value)
+            print(f"Filled {len(fills)} form fields.")
 
             # Upload CV
-            cv_path = os.getenv("CV_PATH", "path/to/your/cv.pdf") # Placeholder for now
-            if os.path.exists(cv_path):
-                await page.set_input_files("input[type='file' i]", cv_path)
-                print(f"Uploaded CV from: {cv_path}")
+            if CV_EXISTS:
+                await page.set_input_files(CV_SEL, CV_PATH)
+                print(f"Uploaded CV from: {CV_PATH}")
             else:
-                print(f"Warning: CV file not found at {cv_path}. Skipping CV upload.")
-
-            # Paste Cover Letter
-            if cover_letter_text:
-                await page.fill("textarea[name*='coverletter' i], textarea[id*='coverletter' i], textarea[name*='message' i], textarea[id*='message' i], textarea[aria-label*='cover letter' i]", cover_letter_text)
-                print("Pasted cover letter text.")
+                print(f"Warning: CV file not found at {CV_PATH}. Skipping CV upload.")
 
             # Click submit button
-            await page.click("button[type='submit' i], input[type='submit' i], button:has-text('Submit' i), button:has-text('Apply' i)")
+            await page.click(SUBMIT_SEL)
             print("Clicked submit button.")
 
             # Basic success check (can be improved with more specific selectors or navigation checks)
@@ -65,7 +91,15 @@ async def submit_application(job_data: dict, user_profile: dict, cover_letter_te
             print(f"An error occurred during application submission: {e}")
             return False
         finally:
-            await browser.close()
+            await context.close()
+
+async def submit_application(job_data: dict, user_profile: dict, cover_letter_text: str) -> bool:
+    """
+    Submits a single application with a dedicated browser.
+    Use ApplicationBot directly to submit several applications with one browser.
+    """
+    async with ApplicationBot() as bot:
+        return await bot.submit(job_data, user_profile, cover_letter_text)
 
 if __name__ == "__main__":
     # Example Usage (for testing purposes)
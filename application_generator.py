@@ -1,4 +1,5 @@
 import os
+import json
 import openai
 import asyncio
 from dotenv import load_dotenv
@@ -7,9 +8,76 @@ from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph
 from reportlab.lib.styles import getSampleStyleSheet
 import io
+from typing import AsyncIterator, BinaryIO
 
 load_dotenv()
 
+_openai_client = None
+
+def _get_openai_client() -> openai.AsyncOpenAI:
+    """
+    Returns the shared AsyncOpenAI client, creating it on first use.
+    Reusing one client keeps its HTTP connection pool alive across calls.
+    """
+    global _openai_client
+    if _openai_client is None:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY not found in environment variables.")
+        _openai_client = openai.AsyncOpenAI(api_key=api_key)
+    return _openai_client
+
+# Fixed instructions, sent as the system message so they qualify for prompt caching
+_SYSTEM_PROMPT = (
+    "You are an AI assistant specialized in writing compelling cover letters. "
+    "Generate a personalized cover letter for the job application described in the user message, "
+    "which is a JSON object with the job details under 'job' and the applicant's profile under 'user'. "
+    "Please write a professional and engaging cover letter, highlighting how the user's skills and experience "
+    "match the job requirements and responsibilities. The cover letter should be concise, "
+    "well-structured, and persuasive. "
+    "Ensure to naturally integrate the user's professional links (LinkedIn, Portfolio, GitHub) "
+    "into the closing section of the cover letter."
+)
+
+# Fields forwarded to the model (jobs rows and profiles built by the orchestrator name some fields differently)
+_JOB_FIELDS = ('title', 'company', 'company_name', 'location', 'description', 'requirements', 'responsibilities')
+_PROFILE_FIELDS = ('name', 'email', 'phone', 'linkedin', 'portfolio_link', 'github', 'github_link',
+                   'skills', 'experience', 'education', 'summary')
+
+def _build_cover_letter_request(job_data: dict, user_profile: dict) -> str:
+    """
+    Builds the variable part of the prompt: the job and profile fields that are set, as JSON.
+    """
+    return json.dumps({
+        'job': {field: job_data[field] for field in _JOB_FIELDS if job_data.get(field)},
+        'user': {field: user_profile[field] for field in _PROFILE_FIELDS if user_profile.get(field)},
+    }, default=str)
+
+async def stream_cover_letter(job_data: dict, user_profile: dict) -> AsyncIterator[str]:
+    """
+    Streams a personalized cover letter as it is generated.
+
+    Args:
+        job_data (dict): A dictionary containing job details from the jobs table.
+        user_profile (dict): A dictionary containing user details from the users table.
+
+    Yields:
+        str: Successive chunks of the cover letter text.
+    """
+    stream = await _get_openai_client().chat.completions.create(
+        model="gpt-4",  # Or another suitable model like "gpt-3.5-turbo"
+        messages=[
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {"role": "user", "content": _build_cover_letter_request(job_data, user_profile)}
+        ],
+        max_tokens=500,
+        temperature=0.7,
+        stream=True,
+    )
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
 async def generate_cover_letter(job_data: dict, user_profile: dict) -> str:
     """
     Generates a personalized cover letter based on job data and user profile.
@@ -21,58 +89,34 @@ async def generate_cover_letter(job_data: dict, user_profile: dict) -> str:
     Returns:
         str: The generated cover letter text.
     """
-    openai.api_key = os.getenv("OPENAI_API_KEY")
-
-    if not openai.api_key:
-        raise ValueError("OPENAI_API_KEY not found in environment variables.")
-
-    # Construct the detailed AI prompt
-    prompt = f"""
-    You are an AI assistant specialized in writing compelling cover letters.
-    Generate a personalized cover letter for the following job application.
-
-    Job Details:
-    Title: {job_data.get('title', 'N/A')}
-    Company: {job_data.get('company', 'N/A')}
-    Location: {job_data.get('location', 'N/A')}
-    Description: {job_data.get('description', 'N/A')}
-    Requirements: {job_data.get('requirements', 'N/A')}
-    Responsibilities: {job_data.get('responsibilities', 'N/A')}
-
-    User Profile:
-    Name: {user_profile.get('name', 'N/A')}
-    Email: {user_profile.get('email', 'N/A')}
-    Phone: {user_profile.get('phone', 'N/A')}
-    LinkedIn: {user_profile.get('linkedin', 'N/A')}
-    Portfolio: {user_profile.get('portfolio_link', 'N/A')}
-    GitHub: {user_profile.get('github_link', 'N/A')}
-    Skills: {', '.join(user_profile.get('skills', []))}
-    Experience: {user_profile.get('experience', 'N/A')}
-    Education: {user_profile.get('education', 'N/A')}
-    Summary: {user_profile.get('summary', 'N/A')}
-
-    Please write a professional and engaging cover letter, highlighting how the user's skills and experience
-    match the job requirements and responsibilities. The cover letter should be concise,
-    well-structured, and persuasive.
-    Ensure to naturally integrate the user's professional links (LinkedIn, Portfolio, GitHub) into the closing section of the cover letter.
-    """
+    _get_openai_client()  # Fail fast if the API key is missing
 
     try:
-        response = await openai.ChatCompletion.acreate(
-            model="gpt-4",  # Or another suitable model like "gpt-3.5-turbo"
-            messages=[
-                {"role": "system", "content": "You are a helpful assistant that writes professional cover letters."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=500,
-            temperature=0.7,
-        )
-        cover_letter = response.choices[0].message['content'].strip()
-        return cover_letter
+        chunks = [chunk async for chunk in stream_cover_letter(job_data, user_profile)]
+        return "".join(chunks).strip()
     except Exception as e:
         print(f"Error generating cover letter: {e}")
         return f"Failed to generate cover letter: {e}"
 
+async def generate_cover_letters_bulk(job_user_pairs: list, concurrency: int = 8) -> list:
+    """
+    Generates cover letters for many (job_data, user_profile) pairs concurrently.
+
+    Args:
+        job_user_pairs (list): A list of (job_data, user_profile) tuples.
+        concurrency (int): Maximum number of OpenAI requests in flight at once.
+
+    Returns:
+        list: The generated cover letter texts, in the same order as job_user_pairs.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _generate_one(job_data: dict, user_profile: dict) -> str:
+        async with semaphore:
+            return await generate_cover_letter(job_data, user_profile)
+
+    return await asyncio.gather(*[_generate_one(job_data, user_profile) for job_data, user_profile in job_user_pairs])
+
 async def update_cv_section(section_type: str, new_content: str, user_id: int) -> None:
     """
     Updates a section of the CV and saves it as a new version in the database.
@@ -84,27 +128,40 @@ async def update_cv_section(section_type: str, new_content: str, user_id: int) -
     """
     client = get_supabase_client()
     
-    # Get current max version for this user and section
-    response = client.table('cv_versions') \
-        .select('version') \
-        .eq('user_id', user_id) \
-        .eq('section_type', section_type) \
-        .order('version', desc=True) \
-        .limit(1) \
-        .execute()
+    # The next version number is computed and inserted in a single statement
+    # (see insert_cv_version in database.create_cv_versions_table)
+    client.rpc('insert_cv_version', {
+        'p_user_id': user_id,
+        'p_section_type': section_type,
+        'p_content': new_content
+    }).execute()
+
+def _generate_cv_pdf_to(target: BinaryIO, cv_text: str) -> None:
+    """
+    Renders CV text as a PDF straight into a writable binary stream using ReportLab.
+
+    Args:
+        target (BinaryIO): File or stream the PDF is written to
+        cv_text (str): Formatted CV text
+    """
+    doc = SimpleDocTemplate(target, pagesize=letter)
+    body_style = getSampleStyleSheet()['BodyText']
     
-    next_version = 1
-    if response.data and len(response.data) > 0:
-        next_version = response.data[0]['version'] + 1
+    # Create one paragraph per CV section ('### ' headings start a new one),
+    # joining its non-empty lines with line breaks
+    paragraphs = []
+    section_lines = []
+    for line in cv_text.split('\n'):
+        line = line.strip()
+        if line.startswith('### ') and section_lines:
+            paragraphs.append(Paragraph('<br/>'.join(section_lines), body_style))
+            section_lines = []
+        if line:
+            section_lines.append(line)
+    if section_lines:
+        paragraphs.append(Paragraph('<br/>'.join(section_lines), body_style))
     
-    # Insert new version
-    new_record = {
-        'user_id': user_id,
-        'section_type': section_type,
-        'content': new_content,
-        'version': next_version
-    }
-    client.table('cv_versions').insert(new_record).execute()
+    doc.build(paragraphs)
 
 def _generate_cv_pdf(cv_text: str) -> bytes:
     """
@@ -116,20 +173,9 @@ def _generate_cv_pdf(cv_text: str) -> bytes:
     Returns:
         bytes: PDF content as bytes
     """
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter)
-    styles = getSampleStyleSheet()
-    
-    # Split text into paragraphs and create PDF elements
-    paragraphs = []
-    for line in cv_text.split('\n'):
-        if line.strip():
-            paragraphs.append(Paragraph(line.strip(), styles['BodyText']))
-    
-    doc.build(paragraphs)
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
-    return pdf_bytes
+    with io.BytesIO() as buffer:
+        _generate_cv_pdf_to(buffer, cv_text)
+        return buffer.getvalue()
 
 async def generate_cv(user_id: int) -> tuple:
     """
@@ -143,27 +189,17 @@ async def generate_cv(user_id: int) -> tuple:
     """
     client = get_supabase_client()
     
-    # Get distinct section types for the user
+    # Fetch every version of every section in one query, newest first
     response = client.table('cv_versions') \
-        .select('section_type') \
+        .select('section_type, version, content') \
         .eq('user_id', user_id) \
+        .order('version', desc=True) \
         .execute()
     
-    section_types = {record['section_type'] for record in response.data}
-    
-    # Get latest version for each section
+    # Keep the latest version for each section
     sections = {}
-    for section_type in section_types:
-        response = client.table('cv_versions') \
-            .select('content') \
-            .eq('user_id', user_id) \
-            .eq('section_type', section_type) \
-            .order('version', desc=True) \
-            .limit(1) \
-            .execute()
-        
-        if response.data:
-            sections[section_type] = response.data[0]['content']
+    for record in response.data:
+        sections.setdefault(record['section_type'], record['content'])
     
     # Order sections logically
     preferred_order = ['summary', 'experience', 'education', 'skills']
@@ -231,12 +267,12 @@ if __name__ == "__main__":
         user_id = 1
         await update_cv_section('summary', 'Experienced software engineer with 5+ years in web development', user_id)
         await update_cv_section('experience', 'Senior Developer at ABC Corp (2020-present)', user_id)
-        cv_text, pdf_bytes = await generate_cv(user_id)
+        cv_text, _ = await generate_cv(user_id)
         print("\n--- Generated CV Text ---")
         print(cv_text)
         print("--------------------------")
         with open('test_cv.pdf', 'wb') as f:
-            f.write(pdf_bytes)
+            _generate_cv_pdf_to(f, cv_text)
         print("PDF saved as test_cv.pdf")
 
     asyncio.run(main())
\ No newline at end of file
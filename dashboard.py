@@ -1,30 +1,134 @@
+import os
+import pickle
+import time
 import streamlit as st
 import pandas as pd
+import numpy as np
 import asyncio
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 from database import get_supabase_client
 
-def get_all_jobs(client):
+# Columns shown in the dashboard tables, the only ones fetched from Supabase
+JOB_DISPLAY_COLUMNS = [
+    'title', 'company_name', 'location', 'publication_date',
+    'relevance_score', 'application_link'
+]
+APPLICATION_DISPLAY_COLUMNS = ['job_id', 'application_date', 'status', 'cv_link']
+
+# Jobs scoring above this are counted as relevant offers
+RELEVANCE_THRESHOLD = 50
+
+# How long fetched tables are reused across reruns before hitting Supabase again
+CACHE_TTL_SECONDS = 30
+
+# On-disk copy of the jobs table, shared by every dashboard process and session.
+# It is reused while the table's row count and highest id are unchanged, for at most
+# JOBS_CACHE_MAX_AGE_SECONDS so in-place updates (e.g. relevance scores) are picked up too.
+JOBS_CACHE_PATH = os.path.join("cache", "jobs.pkl")
+JOBS_CACHE_MAX_AGE_SECONDS = 600
+
+def _jobs_table_version(client):
+    """
+    Returns (row count, highest id) of the 'jobs' table. Only one id is transferred.
+    """
+    response = client.from_('jobs').select('id', count='exact').order('id', desc=True).limit(1).execute()
+    max_id = response.data[0]['id'] if response.data else None
+    return response.count, max_id
+
+def load_jobs_with_local_cache(client):
+    """
+    Returns the displayed columns of every job, from the on-disk cache when it is still
+    current, otherwise from Supabase (refreshing the cache file).
+    """
+    version = (_jobs_table_version(client), tuple(JOB_DISPLAY_COLUMNS))
+    try:
+        with open(JOBS_CACHE_PATH, 'rb') as cache_file:
+            cached = pickle.load(cache_file)
+        if cached['version'] == version and time.time() - cached['saved_at'] < JOBS_CACHE_MAX_AGE_SECONDS:
+            return cached['jobs']
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError, KeyError):
+        pass
+
+    jobs = client.from_('jobs').select(','.join(JOB_DISPLAY_COLUMNS)).execute().data
+
+    # Write to a temporary file first so concurrent readers never see a partial pickle
+    os.makedirs(os.path.dirname(JOBS_CACHE_PATH), exist_ok=True)
+    tmp_path = f"{JOBS_CACHE_PATH}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as cache_file:
+        pickle.dump({'version': version, 'saved_at': time.time(), 'jobs': jobs}, cache_file)
+    os.replace(tmp_path, JOBS_CACHE_PATH)
+    return jobs
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_all_jobs(_client):
     """
     Fetches all job entries from the 'jobs' table in the Supabase database.
+    Results are cached for CACHE_TTL_SECONDS so widget interactions don't refetch them,
+    and backed by the on-disk cache shared between processes.
     """
     try:
-        response = client.from_('jobs').select('*').execute()
-        return response.data
+        return load_jobs_with_local_cache(_client)
     except Exception as e:
         st.error(f"Error fetching jobs: {e}")
         return []
 
-async def get_all_applications(client):
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_all_applications(_client):
     """
     Fetches all application entries from the 'applications' table in the Supabase database.
+    Results are cached for CACHE_TTL_SECONDS so widget interactions don't refetch them.
     """
     try:
-        response = await client.from_('applications').select('*').execute()
+        response = _client.from_('applications').select(','.join(APPLICATION_DISPLAY_COLUMNS)).execute()
         return response.data
     except Exception as e:
         st.error(f"Error fetching applications: {e}")
         return []
 
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def count_relevant_jobs(_client, threshold=RELEVANCE_THRESHOLD):
+    """
+    Counts jobs with a relevance score above the threshold. Postgres does the counting,
+    only the total is returned.
+    """
+    try:
+        response = _client.table('jobs').select('id', count='exact').gt('relevance_score', threshold).limit(0).execute()
+        return response.count or 0
+    except Exception as e:
+        st.error(f"Error counting relevant jobs: {e}")
+        return 0
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_application_status_counts(_client):
+    """
+    Fetches the number of applications per status, aggregated in Postgres by the
+    'application_status_counts' function (see database.create_applications_table).
+    """
+    try:
+        response = _client.rpc('application_status_counts').execute()
+        return response.data
+    except Exception as e:
+        st.error(f"Error fetching application status counts: {e}")
+        return []
+
+async def fetch_dashboard_data(client):
+    """
+    Fetches jobs, applications and their statistics concurrently. The Supabase client is
+    synchronous, so each query runs in a worker thread attached to the current Streamlit script run.
+    """
+    ctx = get_script_run_ctx()
+
+    def run_in_script_ctx(fetch):
+        add_script_run_ctx(ctx=ctx)
+        return fetch(client)
+
+    return await asyncio.gather(
+        asyncio.to_thread(run_in_script_ctx, get_all_jobs),
+        asyncio.to_thread(run_in_script_ctx, get_all_applications),
+        asyncio.to_thread(run_in_script_ctx, count_relevant_jobs),
+        asyncio.to_thread(run_in_script_ctx, get_application_status_counts),
+    )
+
 import asyncio
 import streamlit as st
 import pandas as pd
@@ -32,6 +136,15 @@ from database import get_supabase_client
 import application_generator
 from datetime import date
 
+def run(coro):
+    """
+    Runs a coroutine on this session's event loop, created on the first call and
+    kept in st.session_state so it survives reruns instead of a new loop per asyncio.run.
+    """
+    if 'loop' not in st.session_state:
+        st.session_state.loop = asyncio.new_event_loop()
+    return st.session_state.loop.run_until_complete(coro)
+
 def main():
     st.title("Job Offers Dashboard")
 
@@ -43,32 +156,24 @@ def main():
         st.error("Failed to connect to Supabase. Please check your database configuration.")
         return
 
+    # Fetch data once per rerun and share it between the tabs
+    jobs_data, applications_data, relevant_offers_count, status_count_rows = run(
+        fetch_dashboard_data(supabase_client)
+    )
+
     with tab1:
         # Job Offers section
-        jobs_data = get_all_jobs(supabase_client)
         if jobs_data:
             st.subheader("Found Job Offers")
-            df = pd.DataFrame(jobs_data)
-            display_columns = [
-                'title', 'company_name', 'location', 'publication_date',
-                'relevance_score', 'application_link'
-            ]
-            existing_columns = [col for col in display_columns if col in df.columns]
-            df_display = df[existing_columns]
+            df_display = pd.DataFrame.from_records(jobs_data, columns=JOB_DISPLAY_COLUMNS)
             st.dataframe(df_display)
         else:
             st.info("No job offers found.")
 
         # Sent Applications section
         st.subheader("Sent Applications")
-        applications_data = asyncio.run(get_all_applications(supabase_client))
         if applications_data:
-            df_applications = pd.DataFrame(applications_data)
-            application_display_columns = [
-                'job_id', 'application_date', 'status', 'cover_letter_link', 'cv_link'
-            ]
-            existing_application_columns = [col for col in application_display_columns if col in df_applications.columns]
-            st.dataframe(df_applications[existing_application_columns])
+            st.dataframe(pd.DataFrame.from_records(applications_data, columns=APPLICATION_DISPLAY_COLUMNS))
         else:
             st.info("No applications found.")
 
@@ -97,7 +202,7 @@ def main():
                 full_content = f"{date_range}\n{content}"
                 
                 # Update CV section
-                asyncio.run(application_generator.update_cv_section(
+                run(application_generator.update_cv_section(
                     section_type.lower(),
                     full_content,
                     user_id
@@ -106,14 +211,13 @@ def main():
         
         # CV Preview
         st.subheader("Latest CV Preview")
-        cv_text, _ = asyncio.run(application_generator.generate_cv(user_id))
+        cv_text, _ = run(application_generator.generate_cv(user_id))
         st.markdown(cv_text, unsafe_allow_html=True)
         
         # Version History
         st.subheader("Version History")
         # Get version history from database
-        client = get_supabase_client()
-        response = client.table('cv_versions') \
+        response = supabase_client.table('cv_versions') \
             .select('section_type, version, created_at') \
             .eq('user_id', user_id) \
             .order('created_at', desc=True) \
@@ -126,44 +230,32 @@ def main():
             st.info("No version history available.")
 
     with tab3:
-        # Application Statistics section
-        jobs_data = get_all_jobs(supabase_client)
-        applications_data = asyncio.run(get_all_applications(supabase_client))
-        
+        # Application Statistics section, aggregated by Postgres
         if jobs_data or applications_data:
             st.subheader("Application Statistics")
             
             # Number of relevant offers found
-            if jobs_data:
-                df_jobs = pd.DataFrame(jobs_data)
-                relevant_offers_count = df_jobs[df_jobs['relevance_score'] > 50].shape[0]
-                st.write(f"**Number of relevant offers found:** {relevant_offers_count}")
-            else:
-                st.write("**Number of relevant offers found:** 0")
+            st.write(f"**Number of relevant offers found:** {relevant_offers_count}")
             
             # Number of applications sent
-            if applications_data:
-                df_applications = pd.DataFrame(applications_data)
-                applications_sent_count = df_applications.shape[0]
-                st.write(f"**Number of applications sent:** {applications_sent_count}")
-            else:
-                st.write("**Number of applications sent:** 0")
+            status_counts = pd.DataFrame.from_records(status_count_rows, columns=['status', 'count'])
+            status_counts.columns = ['Status', 'Count']
+            counts = status_counts['Count'].to_numpy()
+            applications_sent_count = int(counts.sum())
+            st.write(f"**Number of applications sent:** {applications_sent_count}")
             
             # Response rate
-            if applications_data and applications_sent_count > 0:
-                responded_applications_count = df_applications[
-                    df_applications['status'].isin(['interview', 'accepted'])
-                ].shape[0]
+            if applications_sent_count > 0:
+                responded = np.isin(status_counts['Status'].to_numpy(), ('interview', 'accepted'))
+                responded_applications_count = int(counts[responded].sum())
                 response_rate = (responded_applications_count / applications_sent_count) * 100
                 st.write(f"**Response rate:** {response_rate:.2f}%")
             else:
                 st.write("**Response rate:** N/A (No applications sent)")
 
             # Application Status Overview
-            if applications_data:
+            if applications_sent_count > 0:
                 st.subheader("Application Status Overview")
-                status_counts = df_applications['status'].value_counts().reset_index()
-                status_counts.columns = ['Status', 'Count']
                 
                 col1, col2 = st.columns(2)
                 with col1:
@@ -1,19 +1,35 @@
 import os
+import asyncio
+import logging
 from supabase import create_client, Client
 import datetime
+from typing import Optional
 
 # Placeholders for Supabase credentials
 SUPABASE_URL = os.environ.get("SUPABASE_URL", "YOUR_SUPABASE_URL")
 SUPABASE_KEY = os.environ.get("SUPABASE_KEY", "YOUR_SUPABASE_KEY")
 
+logger = logging.getLogger(__name__)
+
+_CLIENT: Optional[Client] = None
+
 def get_supabase_client() -> Client:
-    """Initializes and returns a Supabase client."""
+    """
+    Initializes and returns a Supabase client.
+    The client is created once and shared, so every caller reuses its HTTP connection pool.
+    """
+    global _CLIENT
     if not SUPABASE_URL or not SUPABASE_KEY:
         raise ValueError("Supabase URL and Key must be set in environment variables or replaced in database.py")
-    return create_client(SUPABASE_URL, SUPABASE_KEY)
+    if _CLIENT is None:
+        _CLIENT = create_client(SUPABASE_URL, SUPABASE_KEY)
+    return _CLIENT
 
-def create_jobs_table(client: Client):
-    """Creates the 'jobs' table if it doesn't exist."""
+async def create_jobs_table(client: Client):
+    """
+    Creates the 'jobs' table if it doesn't exist, along with the
+    'update_relevance_scores' function used to save many scores at once.
+    """
     try:
         # Supabase client doesn't have a direct 'execute_sql' method for DDL.
         # We'll use the postgrest client directly for this.
@@ -31,6 +47,23 @@ def create_jobs_table(client: Client):
             relevance_score REAL,
             status VARCHAR(50) DEFAULT 'pending'
         );
+
+        -- Jobs waiting for an application, searched by relevance score (get_jobs_for_application)
+        CREATE INDEX IF NOT EXISTS jobs_pending_score_idx ON jobs (relevance_score) WHERE status = 'pending';
+        -- Jobs not scored yet (get_unscored_jobs)
+        CREATE INDEX IF NOT EXISTS jobs_unscored_idx ON jobs (id) WHERE relevance_score IS NULL OR relevance_score = 0;
+
+        CREATE OR REPLACE FUNCTION update_relevance_scores(scores JSONB)
+        RETURNS INTEGER AS $$
+            WITH updated AS (
+                UPDATE jobs
+                SET relevance_score = new_scores.relevance_score
+                FROM jsonb_to_recordset(scores) AS new_scores(id INTEGER, relevance_score REAL)
+                WHERE jobs.id = new_scores.id
+                RETURNING 1
+            )
+            SELECT COUNT(*)::INTEGER FROM updated;
+        $$ LANGUAGE sql;
         """
         # Note: Direct SQL execution for DDL is not directly exposed via the Python client's
         # standard methods. For creating tables, you typically manage this outside the application
@@ -39,7 +72,7 @@ def create_jobs_table(client: Client):
         # but the primary client methods are for data manipulation.
         # As a workaround for this exercise, we'll simulate the table creation.
         # In a real scenario, you'd ensure the table exists via migrations or the Supabase dashboard.
-        print("Attempting to create 'jobs' table (or ensuring it exists)...")
+        logger.info("Attempting to create 'jobs' table (or ensuring it exists)...")
         # The Supabase Python client is primarily for data manipulation (CRUD).
         # DDL operations like CREATE TABLE are usually handled via migrations or the Supabase UI.
         # For the purpose of this exercise, we'll acknowledge this limitation and proceed
@@ -47,14 +80,17 @@ def create_jobs_table(client: Client):
         # database connection if raw SQL is absolutely necessary from Python.
         # Since the prompt specifically asks for a function to "create jobs table",
         # we'll include the SQL, but note the client's typical usage.
-        print(f"SQL to create table: {sql_command}")
-        print("Please ensure this SQL is executed in your Supabase instance.")
+        logger.info("SQL to create table: %s", sql_command)
+        logger.info("Please ensure this SQL is executed in your Supabase instance.")
 
     except Exception as e:
-        print(f"Error creating jobs table: {e}")
+        logger.error("Error creating jobs table: %s", e)
 
 async def create_applications_table(client: Client):
-    """Creates the 'applications' table if it doesn't exist."""
+    """
+    Creates the 'applications' table if it doesn't exist, along with the
+    'application_status_counts' function used by the dashboard statistics.
+    """
     try:
         sql_command = """
         CREATE TABLE IF NOT EXISTS applications (
@@ -68,74 +104,137 @@ async def create_applications_table(client: Client):
             notes TEXT,
             UNIQUE(job_id, user_id)
         );
+
+        CREATE OR REPLACE FUNCTION application_status_counts()
+        RETURNS TABLE(status VARCHAR, count BIGINT) AS $$
+            SELECT applications.status, COUNT(*)
+            FROM applications
+            GROUP BY applications.status
+            ORDER BY COUNT(*) DESC;
+        $$ LANGUAGE sql STABLE;
         """
-        print("Attempting to create 'applications' table (or ensuring it exists)...")
-        print(f"SQL to create table: {sql_command}")
-        print("Please ensure this SQL is executed in your Supabase instance.")
+        logger.info("Attempting to create 'applications' table (or ensuring it exists)...")
+        logger.info("SQL to create table: %s", sql_command)
+        logger.info("Please ensure this SQL is executed in your Supabase instance.")
     except Exception as e:
-        print(f"Error creating applications table: {e}")
+        logger.error("Error creating applications table: %s", e)
+
+# Columns of the 'jobs' table declared NOT NULL (see create_jobs_table)
+JOB_REQUIRED_FIELDS = ('title', 'description', 'company_name', 'location', 'application_link')
+
+def save_jobs_bulk(client: Client, jobs: list, batch_size: int = 500) -> list:
+    """
+    Saves many jobs into the 'jobs' table with one upsert request per batch.
+    Jobs whose 'application_link' already exists are ignored by Postgres.
+    Jobs missing a required field are skipped beforehand, so they can't make a whole batch
+    fail; if a batch still fails, its jobs are retried one by one.
+
+    Returns:
+        list: The newly inserted job rows (duplicates are not included).
+    """
+    valid_jobs = []
+    for job in jobs:
+        missing_fields = [field for field in JOB_REQUIRED_FIELDS if not job.get(field)]
+        if missing_fields:
+            logger.warning("Skipping job %s: missing %s.", job.get('application_link') or job.get('title'), ', '.join(missing_fields))
+        else:
+            valid_jobs.append(job)
+
+    saved_jobs = []
+    for start in range(0, len(valid_jobs), batch_size):
+        batch = valid_jobs[start:start + batch_size]
+        try:
+            response = client.table('jobs').upsert(batch, on_conflict='application_link', ignore_duplicates=True).execute()
+            saved_jobs.extend(response.data)
+        except Exception as e:
+            logger.error("An unexpected error occurred while saving a batch of %s jobs, retrying them one by one: %s", len(batch), e)
+            for job in batch:
+                try:
+                    response = client.table('jobs').upsert(job, on_conflict='application_link', ignore_duplicates=True).execute()
+                    saved_jobs.extend(response.data)
+                except Exception as job_e:
+                    logger.error("An unexpected error occurred while saving job %s: %s", job.get('application_link'), job_e)
+    logger.debug("Saved %s new jobs out of %s.", len(saved_jobs), len(jobs))
+    return saved_jobs
 
 def save_job_data(client: Client, job_data: dict):
     """
     Saves job data into the 'jobs' table.
     Handles potential duplicate 'application_link' entries by ignoring them.
+
+    Returns:
+        dict: The saved job row, or None if it was a duplicate or could not be saved.
     """
-    try:
-        response = client.table('jobs').insert(job_data).execute()
-        if response.data:
-            print(f"Job data saved successfully: {response.data}")
-        elif response.error:
-            if "duplicate key value violates unique constraint" in response.error.get("message", ""):
-                print(f"Duplicate application_link found, ignoring: {job_data.get('application_link')}")
-            else:
-                print(f"Error saving job data: {response.error}")
-    except Exception as e:
-        print(f"An unexpected error occurred while saving job data: {e}")
+    saved_jobs = save_jobs_bulk(client, [job_data])
+    return saved_jobs[0] if saved_jobs else None
 
 async def update_job_relevance_score(client: Client, job_id: int, score: float):
     """
     Updates the relevance score for a specific job in the 'jobs' table.
     """
     try:
-        response = client.table('jobs').update({'relevance_score': score}).eq('id', job_id).execute()
+        # The client is synchronous; running the request in a thread lets concurrent updates overlap
+        response = await asyncio.to_thread(client.table('jobs').update({'relevance_score': score}).eq('id', job_id).execute)
         if response.data:
-            print(f"Job {job_id} relevance score updated to {score}.")
+            logger.debug("Job %s relevance score updated to %s.", job_id, score)
         elif response.error:
-            print(f"Error updating relevance score for job {job_id}: {response.error}")
+            logger.error("Error updating relevance score for job %s: %s", job_id, response.error)
+    except Exception as e:
+        logger.error("An unexpected error occurred while updating job relevance score: %s", e)
+
+async def update_job_relevance_scores(client: Client, scores: dict):
+    """
+    Updates the relevance scores of many jobs in the 'jobs' table with a single request,
+    through the 'update_relevance_scores' function (see create_jobs_table).
+
+    Args:
+        client: The Supabase client.
+        scores (dict): The new relevance score of each job, keyed by job ID.
+
+    Returns:
+        int: The number of jobs updated.
+    """
+    if not scores:
+        return 0
+    payload = [{'id': job_id, 'relevance_score': score} for job_id, score in scores.items()]
+    try:
+        response = await asyncio.to_thread(client.rpc('update_relevance_scores', {'scores': payload}).execute)
+        logger.debug("Relevance scores of %s jobs updated.", response.data)
+        return response.data or 0
     except Exception as e:
-        print(f"An unexpected error occurred while updating job relevance score: {e}")
+        logger.error("An unexpected error occurred while updating the relevance scores of %s jobs: %s", len(scores), e)
+        return 0
 
 async def get_user_profile(client: Client, user_id: int):
     """
     Fetches a user's profile information (including preferred job criteria, profile text, summary, skills, and professional links) from the 'users' table.
     """
     try:
-        response = await client.table('users').select('preferred_criteria, profile_text, summary, skills, linkedin_link, github_link, portfolio_link').eq('id', user_id).single().execute()
+        response = await asyncio.to_thread(client.table('users').select('preferred_criteria, profile_text, summary, skills, linkedin_link, github_link, portfolio_link').eq('id', user_id).single().execute)
         if response.data:
-            print(f"User profile fetched successfully for user_id {user_id}.")
+            logger.debug("User profile fetched successfully for user_id %s.", user_id)
             return response.data
         elif response.error:
-            print(f"Error fetching user profile for user_id {user_id}: {response.error}")
+            logger.error("Error fetching user profile for user_id %s: %s", user_id, response.error)
             return None
     except Exception as e:
-        print(f"An unexpected error occurred while fetching user profile: {e}")
+        logger.error("An unexpected error occurred while fetching user profile: %s", e)
         return None
 
 async def get_unscored_jobs(client: Client):
     """
     Fetches all jobs from the 'jobs' table that have not yet been scored
     (i.e., relevance_score is NULL or 0).
+    The predicate runs in the database (see jobs_unscored_idx); only the columns used for scoring are returned.
     """
     try:
-        response = await client.table('jobs').select('*').or_('relevance_score.is.null,relevance_score.eq.0').execute()
-        if response.data:
-            print(f"Found {len(response.data)} unscored jobs.")
-            return response.data
-        elif response.error:
-            print(f"Error fetching unscored jobs: {response.error}")
-            return []
+        response = await asyncio.to_thread(
+            client.table('jobs').select('id, title, company_name, description').or_('relevance_score.is.null,relevance_score.eq.0').execute
+        )
+        logger.debug("Found %s unscored jobs.", len(response.data))
+        return response.data
     except Exception as e:
-        print(f"An unexpected error occurred while fetching unscored jobs: {e}")
+        logger.error("An unexpected error occurred while fetching unscored jobs: %s", e)
         return []
 
 async def get_jobs_for_application(client: Client, relevance_threshold: int):
@@ -143,17 +242,18 @@ async def get_jobs_for_application(client: Client, relevance_threshold: int):
     Retrieves jobs from the 'jobs' table that meet certain criteria for application:
     - relevance_score above a specified threshold
     - status is not 'applied'
+    Both criteria run in the database (see jobs_pending_score_idx); only the columns
+    used to generate an application are returned.
     """
     try:
-        response = await client.table('jobs').select('*').gte('relevance_score', relevance_threshold).eq('status', 'pending').execute()
-        if response.data:
-            print(f"Found {len(response.data)} jobs for application with relevance score >= {relevance_threshold}.")
-            return response.data
-        elif response.error:
-            print(f"Error fetching jobs for application: {response.error}")
-            return []
+        response = await asyncio.to_thread(
+            client.table('jobs').select('id, title, company_name, location, description')
+            .gte('relevance_score', relevance_threshold).eq('status', 'pending').execute
+        )
+        logger.debug("Found %s jobs for application with relevance score >= %s.", len(response.data), relevance_threshold)
+        return response.data
     except Exception as e:
-        print(f"An unexpected error occurred while fetching jobs for application: {e}")
+        logger.error("An unexpected error occurred while fetching jobs for application: %s", e)
         return []
 
 async def update_job_status(client: Client, job_id: int, status: str):
@@ -161,15 +261,27 @@ async def update_job_status(client: Client, job_id: int, status: str):
     Updates the status for a specific job in the 'jobs' table.
     """
     try:
-        response = await client.table('jobs').update({'status': status}).eq('id', job_id).execute()
+        response = await asyncio.to_thread(client.table('jobs').update({'status': status}).eq('id', job_id).execute)
         if response.data:
-            print(f"Job {job_id} status updated to '{status}'.")
+            logger.debug("Job %s status updated to '%s'.", job_id, status)
         elif response.error:
-            print(f"Error updating status for job {job_id}: {response.error}")
+            logger.error("Error updating status for job %s: %s", job_id, response.error)
     except Exception as e:
-        print(f"An unexpected error occurred while updating job status: {e}")
+        logger.error("An unexpected error occurred while updating job status: %s", e)
         return None
 
+async def update_jobs_status(client: Client, job_ids: list, status: str):
+    """
+    Updates the status of several jobs in the 'jobs' table with a single request.
+    """
+    if not job_ids:
+        return
+    try:
+        response = await asyncio.to_thread(client.table('jobs').update({'status': status}).in_('id', list(job_ids)).execute)
+        logger.debug("Status of %s jobs updated to '%s'.", len(response.data), status)
+    except Exception as e:
+        logger.error("An unexpected error occurred while updating the status of %s jobs: %s", len(job_ids), e)
+
 async def create_users_table(client: Client):
     """Creates the 'users' table if it doesn't exist."""
     try:
@@ -182,11 +294,11 @@ async def create_users_table(client: Client):
             created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
         );
         """
-        print("Attempting to create 'users' table (or ensuring it exists)...")
-        print(f"SQL to create table: {sql_command}")
-        print("Please ensure this SQL is executed in your Supabase instance.")
+        logger.info("Attempting to create 'users' table (or ensuring it exists)...")
+        logger.info("SQL to create table: %s", sql_command)
+        logger.info("Please ensure this SQL is executed in your Supabase instance.")
     except Exception as e:
-        print(f"Error creating users table: {e}")
+        logger.error("Error creating users table: %s", e)
 
 async def create_skills_table(client: Client):
     """Creates the 'skills' table if it doesn't exist."""
@@ -197,11 +309,11 @@ async def create_skills_table(client: Client):
             name VARCHAR(255) UNIQUE NOT NULL
         );
         """
-        print("Attempting to create 'skills' table (or ensuring it exists)...")
-        print(f"SQL to create table: {sql_command}")
-        print("Please ensure this SQL is executed in your Supabase instance.")
+        logger.info("Attempting to create 'skills' table (or ensuring it exists)...")
+        logger.info("SQL to create table: %s", sql_command)
+        logger.info("Please ensure this SQL is executed in your Supabase instance.")
     except Exception as e:
-        print(f"Error creating skills table: {e}")
+        logger.error("Error creating skills table: %s", e)
 
 async def create_user_skills_table(client: Client):
     """Creates the 'user_skills' table if it doesn't exist."""
@@ -213,11 +325,11 @@ async def create_user_skills_table(client: Client):
             PRIMARY KEY (user_id, skill_id)
         );
         """
-        print("Attempting to create 'user_skills' table (or ensuring it exists)...")
-        print(f"SQL to create table: {sql_command}")
-        print("Please ensure this SQL is executed in your Supabase instance.")
+        logger.info("Attempting to create 'user_skills' table (or ensuring it exists)...")
+        logger.info("SQL to create table: %s", sql_command)
+        logger.info("Please ensure this SQL is executed in your Supabase instance.")
     except Exception as e:
-        print(f"Error creating user_skills table: {e}")
+        logger.error("Error creating user_skills table: %s", e)
 
 async def create_job_skills_table(client: Client):
     """Creates the 'job_skills' table if it doesn't exist."""
@@ -229,8 +341,44 @@ async def create_job_skills_table(client: Client):
             PRIMARY KEY (job_id, skill_id)
         );
         """
-        print("Attempting to create 'job_skills' table (or ensuring it exists)...")
-        print(f"SQL to create table: {sql_command}")
+        logger.info("Attempting to create 'job_skills' table (or ensuring it exists)...")
+        logger.info("SQL to create table: %s", sql_command)
+        logger.info("Please ensure this SQL is executed in your Supabase instance.")
+    except Exception as e:
+        logger.error("Error creating job_skills table: %s", e)
+
+async def create_cv_versions_table(client: Client):
+    """
+    Creates the 'cv_versions' table if it doesn't exist, along with the
+    'insert_cv_version' function that assigns the next version number atomically.
+    """
+    try:
+        sql_command = """
+        CREATE TABLE IF NOT EXISTS cv_versions (
+            id SERIAL PRIMARY KEY,
+            user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            section_type VARCHAR(50) NOT NULL,
+            content TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(user_id, section_type, version)
+        );
+
+        CREATE OR REPLACE FUNCTION insert_cv_version(p_user_id INTEGER, p_section_type VARCHAR, p_content TEXT)
+        RETURNS INTEGER AS $$
+            INSERT INTO cv_versions (user_id, section_type, content, version)
+            SELECT p_user_id, p_section_type, p_content, COALESCE(MAX(version), 0) + 1
+            FROM cv_versions
+            WHERE user_id = p_user_id AND section_type = p_section_type
+            RETURNING version;
+        $$ LANGUAGE sql;
+        """
+        logger.info("Attempting to create 'cv_versions' table (or ensuring it exists)...")
+        logger.info("SQL to create table: %s", sql_command)
+        logger.info("Please ensure this SQL is executed in your Supabase instance.")
+    except Exception as e:
+        logger.error("Error creating cv_versions table: %s", e)
+
 async def save_application_details(client: Client, job_id: int, cover_letter_text: str, user_id: int, cv_link: str = None, status: str = 'sent', notes: str = None):
     """
     Saves application details into the 'applications' table.
@@ -245,20 +393,52 @@ async def save_application_details(client: Client, job_id: int, cover_letter_tex
             "status": status,
             "notes": notes
         }
-        response = client.table('applications').insert(data).execute()
+        response = await asyncio.to_thread(client.table('applications').insert(data).execute)
         if response.data:
-            print(f"Application details saved successfully for job_id {job_id}: {response.data}")
+            logger.debug("Application details saved successfully for job_id %s: %s", job_id, response.data)
             return response.data[0]['id']
         elif response.error:
-            print(f"Error saving application details for job_id {job_id}: {response.error}")
+            logger.error("Error saving application details for job_id %s: %s", job_id, response.error)
             return None
     except Exception as e:
-        print(f"An unexpected error occurred while saving application details: {e}")
+        logger.error("An unexpected error occurred while saving application details: %s", e)
         return None
 
-        print("Please ensure this SQL is executed in your Supabase instance.")
+async def save_applications_bulk(client: Client, applications: list):
+    """
+    Saves many applications into the 'applications' table in a single insert.
+
+    Args:
+        client: The Supabase client.
+        applications (list): Dictionaries with 'job_id', 'user_id' and 'cover_letter_text',
+                             and optionally 'cv_link', 'status' (default 'sent') and 'notes'.
+
+    Returns:
+        list: The IDs of the saved applications, in the same order, or an empty list on error.
+    """
+    if not applications:
+        return []
+    today = datetime.date.today().isoformat()
+    rows = [
+        {
+            "job_id": application["job_id"],
+            "user_id": application["user_id"],
+            "application_date": today,
+            "cover_letter_text": application["cover_letter_text"],
+            "cv_link": application.get("cv_link"),
+            "status": application.get("status", 'sent'),
+            "notes": application.get("notes")
+        }
+        for application in applications
+    ]
+    try:
+        response = await asyncio.to_thread(client.table('applications').insert(rows).execute)
+        logger.debug("Saved %s applications.", len(response.data))
+        return [row['id'] for row in response.data]
     except Exception as e:
-        print(f"Error creating job_skills table: {e}")
+        logger.error("An unexpected error occurred while saving %s applications: %s", len(rows), e)
+        return []
+
 async def is_job_already_scraped(client: Client, application_link: str) -> bool:
     """
     Checks if a job with a given `application_link` already exists in the `jobs` table.
@@ -270,10 +450,56 @@ async def is_job_already_scraped(client: Client, application_link: str) -> bool:
     Returns:
         bool: True if a job with the application link is found, False otherwise.
     """
-    response = await client.from_('jobs').select('id').eq('application_link', application_link).execute()
-    if response.data:
-        return True
-    return False
+    return not await filter_new_application_links(client, [application_link])
+
+def get_job_descriptions(client: Client, page_size: int = 1000) -> list:
+    """
+    Fetches the description of every job in the 'jobs' table, page_size rows per request
+    (PostgREST caps the rows returned by a single request).
+
+    Returns:
+        list: The job descriptions (empty ones included as '').
+    """
+    descriptions = []
+    offset = 0
+    try:
+        while True:
+            response = client.table('jobs').select('description').order('id').range(offset, offset + page_size - 1).execute()
+            descriptions.extend(row['description'] or '' for row in response.data)
+            if len(response.data) < page_size:
+                break
+            offset += page_size
+    except Exception as e:
+        logger.error("An unexpected error occurred while fetching job descriptions: %s", e)
+    return descriptions
+
+# Links looked up per query by filter_new_application_links, keeping the request URL short
+LINKS_PER_QUERY = 200
+
+async def filter_new_application_links(client: Client, application_links: list) -> list:
+    """
+    Filters out the application links that already exist in the `jobs` table,
+    with one query per LINKS_PER_QUERY links (run concurrently in worker threads).
+
+    Args:
+        client: The Supabase client.
+        application_links (list): The application links to check.
+
+    Returns:
+        list: The links not found in the `jobs` table, in their original order.
+    """
+    if not application_links:
+        return []
+    application_links = list(application_links)
+    responses = await asyncio.gather(*[
+        asyncio.to_thread(
+            client.from_('jobs').select('application_link')
+            .in_('application_link', application_links[start:start + LINKS_PER_QUERY]).execute
+        )
+        for start in range(0, len(application_links), LINKS_PER_QUERY)
+    ])
+    existing_links = {row['application_link'] for response in responses for row in response.data}
+    return [link for link in application_links if link not in existing_links]
 
 async def log_application_status(client: Client, application_id: int, status: str, notes: str = None):
     """
@@ -286,26 +512,32 @@ async def log_application_status(client: Client, application_id: int, status: st
         }
         response = client.table('applications').update(data).eq('id', application_id).execute()
         if response.data:
-            print(f"Application {application_id} status updated to '{status}'.")
+            logger.debug("Application %s status updated to '%s'.", application_id, status)
         elif response.error:
-            print(f"Error updating status for application {application_id}: {response.error}")
+            logger.error("Error updating status for application %s: %s", application_id, response.error)
     except Exception as e:
-        print(f"An unexpected error occurred while logging application status: {e}")
+        logger.error("An unexpected error occurred while logging application status: %s", e)
 
 async def initialize_database(client: Client):
     """Initializes all necessary database tables."""
-    print("Initializing database tables...")
-    await create_users_table(client)
-    await create_skills_table(client)
-    await create_jobs_table(client) # jobs table is needed for applications and job_skills
-    await create_applications_table(client)
-    await create_user_skills_table(client)
-    await create_job_skills_table(client)
-    await create_cv_versions_table(client)
-    print("Database initialization complete.")
+    logger.info("Initializing database tables...")
+    # Tables without foreign keys first, then the tables referencing them
+    await asyncio.gather(
+        create_users_table(client),
+        create_skills_table(client),
+        create_jobs_table(client),
+    )
+    await asyncio.gather(
+        create_applications_table(client),
+        create_user_skills_table(client),
+        create_job_skills_table(client),
+        create_cv_versions_table(client),
+    )
+    logger.info("Database initialization complete.")
 
 if __name__ == "__main__":
     # Example usage (for testing purposes)
+    logging.basicConfig(level=logging.DEBUG)
     print("Running example usage...")
     import asyncio
     try:
@@ -13,7 +13,29 @@ async def is_duplicate_application(client, job_id: int, user_id: int) -> bool:
     Returns:
         bool: True if a duplicate application is found, False otherwise.
     """
-    response = await client.from_('applications').select('*').eq('job_id', job_id).eq('user_id', user_id).execute()
-    if response.data:
-        return True
-    return False
\ No newline at end of file
+    # HEAD request: only the row count comes back, no row data
+    response = await asyncio.to_thread(
+        client.from_('applications').select('id', count='exact', head=True).eq('job_id', job_id).eq('user_id', user_id).limit(1).execute
+    )
+    return (response.count or 0) > 0
+
+async def find_existing_application_job_ids(client, user_id: int, job_ids: list) -> set:
+    """
+    Checks the `applications` table for which of the given jobs the user has already
+    applied to, using a single query.
+
+    Args:
+        client: The Supabase client.
+        user_id (int): The ID of the user.
+        job_ids (list): The IDs of the jobs to check.
+
+    Returns:
+        set: The subset of job_ids that already have an application by the user.
+    """
+    if not job_ids:
+        return set()
+    # The client is synchronous; the request runs in a worker thread so the event loop stays free
+    response = await asyncio.to_thread(
+        client.from_('applications').select('job_id').eq('user_id', user_id).in_('job_id', list(job_ids)).execute
+    )
+    return {row['job_id'] for row in response.data}
\ No newline at end of file
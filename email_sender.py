@@ -1,26 +1,19 @@
 import os
-import smtplib
+import pathlib
+import aiosmtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
+from email.mime.application import MIMEApplication
 from dotenv import load_dotenv
 
 load_dotenv()
 
-async def send_application_email(recipient_email, job_title, company_name, cover_letter_text, cv_path=None):
+def _get_smtp_settings():
     """
-    Sends an application email with the provided details and an optional CV attachment.
-
-    Args:
-        recipient_email (str): The email address of the recipient.
-        job_title (str): The title of the job being applied for.
-        company_name (str): The name of the company.
-        cover_letter_text (str): The content of the cover letter to be used as the email body.
-        cv_path (str, optional): The path to the CV file to be attached. Defaults to None.
+    Reads the SMTP settings from the environment.
 
     Returns:
-        bool: True if the email is sent successfully, False otherwise.
+        tuple: (sender_email, sender_password, smtp_server, smtp_port), or None if credentials are missing.
     """
     sender_email = os.getenv("SENDER_EMAIL")
     sender_password = os.getenv("SENDER_PASSWORD")
@@ -28,9 +21,22 @@ async def send_application_email(recipient_email, job_title, company_name, cover
     smtp_port = int(os.getenv("SMTP_PORT", 587)) # Default to 587 if not set
 
     if not all([sender_email, sender_password, smtp_server]):
-        print("Error: Missing environment variables for email credentials.")
-        return False
+        return None
+    return sender_email, sender_password, smtp_server, smtp_port
+
+def _build_cv_part(cv_path):
+    """
+    Reads a CV file and wraps it in a base64-encoded MIME attachment.
+    """
+    filename = os.path.basename(cv_path)
+    part = MIMEApplication(pathlib.Path(cv_path).read_bytes(), Name=filename)
+    part['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return part
 
+def _build_application_message(sender_email, recipient_email, job_title, company_name, cover_letter_text, cv_part=None):
+    """
+    Builds the application email, attaching the given CV part if any.
+    """
     msg = MIMEMultipart()
     msg['From'] = sender_email
     msg['To'] = recipient_email
@@ -38,33 +44,134 @@ async def send_application_email(recipient_email, job_title, company_name, cover
 
     msg.attach(MIMEText(cover_letter_text, 'plain'))
 
-    if cv_path:
-        try:
-            with open(cv_path, "rb") as attachment:
-                part = MIMEBase("application", "octet-stream")
-                part.set_payload(attachment.read())
-            encoders.encode_base64(part)
-            part.add_header(
-                "Content-Disposition",
-                f"attachment; filename= {os.path.basename(cv_path)}",
-            )
-            msg.attach(part)
-        except FileNotFoundError:
-            print(f"Error: CV file not found at {cv_path}")
-            return False
-        except Exception as e:
-            print(f"Error attaching CV: {e}")
-            return False
+    if cv_part is not None:
+        msg.attach(cv_part)
+
+    return msg
+
+class SmtpSession:
+    """
+    An authenticated SMTP connection reused for several emails.
+
+    Uses aiosmtplib, so waiting on the server yields the event loop to other tasks.
+
+    Usage:
+        async with SmtpSession() as session:
+            for msg in messages:
+                await session.send(msg)
+    """
+
+    def __init__(self):
+        settings = _get_smtp_settings()
+        if settings is None:
+            raise ValueError("Missing environment variables for email credentials.")
+        self.sender_email, self.sender_password, self.smtp_server, self.smtp_port = settings
+        self.server = None
+
+    async def __aenter__(self):
+        self.server = aiosmtplib.SMTP(hostname=self.smtp_server, port=self.smtp_port, start_tls=True)  # Secure the connection
+        await self.server.connect()
+        await self.server.login(self.sender_email, self.sender_password)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.server.quit()
+
+    async def send(self, msg):
+        await self.server.send_message(msg)
+
+async def send_application_email(recipient_email, job_title, company_name, cover_letter_text, cv_path=None):
+    """
+    Sends an application email with the provided details and an optional CV attachment.
+
+    Args:
+        recipient_email (str): The email address of the recipient.
+        job_title (str): The title of the job being applied for.
+        company_name (str): The name of the company.
+        cover_letter_text (str): The content of the cover letter to be used as the email body.
+        cv_path (str, optional): The path to the CV file to be attached. Defaults to None.
+
+    Returns:
+        bool: True if the email is sent successfully, False otherwise.
+    """
+    results = await send_application_emails([{
+        "recipient_email": recipient_email,
+        "job_title": job_title,
+        "company_name": company_name,
+        "cover_letter_text": cover_letter_text,
+        "cv_path": cv_path,
+    }])
+    return results[0]
+
+async def send_application_emails(email_specs):
+    """
+    Sends several application emails over a single SMTP connection.
+
+    Args:
+        email_specs (list): A list of dictionaries with the arguments of send_application_email
+                            ('recipient_email', 'job_title', 'company_name', 'cover_letter_text'
+                            and optionally 'cv_path').
+
+    Returns:
+        list: One bool per email, True if it was sent successfully.
+    """
+    results = [False] * len(email_specs)
 
     try:
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
-            server.starttls()  # Secure the connection
-            server.login(sender_email, sender_password)
-            server.send_message(msg)
-        return True
+        session = SmtpSession()
+    except ValueError:
+        print("Error: Missing environment variables for email credentials.")
+        return results
+
+    # Each distinct CV file is read and encoded once, and its part shared by the whole batch
+    cv_parts = {}
+    sendable = []
+    for index, spec in enumerate(email_specs):
+        cv_path = spec.get("cv_path")
+        if cv_path and cv_path not in cv_parts:
+            try:
+                cv_parts[cv_path] = _build_cv_part(cv_path)
+            except FileNotFoundError:
+                print(f"Error: CV file not found at {cv_path}")
+                continue
+            except Exception as e:
+                print(f"Error attaching CV: {e}")
+                continue
+        sendable.append((index, spec))
+
+    if not sendable:
+        return results
+
+    # Emails sharing a body and CV reuse one message; only its recipient and subject change
+    templates = {}
+    try:
+        async with session:
+            for index, spec in sendable:
+                cv_path = spec.get("cv_path")
+                template_key = (spec["cover_letter_text"], cv_path)
+                msg = templates.get(template_key)
+                if msg is None:
+                    msg = _build_application_message(
+                        session.sender_email,
+                        spec["recipient_email"],
+                        spec["job_title"],
+                        spec["company_name"],
+                        spec["cover_letter_text"],
+                        cv_part=cv_parts.get(cv_path),
+                    )
+                    templates[template_key] = msg
+                else:
+                    msg.replace_header('To', spec["recipient_email"])
+                    msg.replace_header('Subject', f"Application for {spec['job_title']} at {spec['company_name']}")
+                try:
+                    await session.send(msg)
+                    results[index] = True
+                except Exception as e:
+                    print(f"Error sending email to {spec['recipient_email']}: {e}")
     except Exception as e:
         print(f"Error sending email: {e}")
-        return False
+
+    return results
 
 if __name__ == "__main__":
     # Example usage (for testing purposes)
@@ -1,8 +1,54 @@
+import itertools
 import re
+import pyarrow as pa
+import pyarrow.compute as pc
+
+def _alternation(words):
+    """
+    Escaped, lowercased alternation of the given words, e.g. "(?:python|django)".
+    """
+    return '(?:' + '|'.join(re.escape(word.lower()) for word in words) + ')'
+
+def _keywords_regex(keywords):
+    """
+    Single pattern matching any of the keywords as a word prefix
+    (e.g. "Python" matches "python", "Pythonic"), so the text is scanned once for all of them.
+    """
+    return r'\b' + _alternation(keywords) + r'\w*'
+
+def _languages_regex(langs):
+    """
+    Single pattern matching any of the languages as a whole word.
+    """
+    return r'\b' + _alternation(langs) + r'\b'
+
+def _field_text(value):
+    """
+    Text of a job field: list values (e.g. scraped skills) joined with spaces, missing values as ''.
+    """
+    if not value:
+        return ''
+    if isinstance(value, (list, tuple, set)):
+        return ' '.join(str(item) for item in value)
+    return str(value)
+
+def _field_array(jobs, *fields):
+    """
+    Arrow string array of the given job fields (joined with spaces).
+    """
+    return pa.array([' '.join(_field_text(job.get(field)) for field in fields) for job in jobs], type=pa.string())
+
+def _compress(jobs, mask):
+    """
+    Keeps the jobs whose entry in the Arrow boolean mask is true.
+    """
+    return list(itertools.compress(jobs, mask.to_pylist()))
 
 def filter_jobs(job_data, criteria):
     """
     Filters a list of job dictionaries based on user-defined criteria.
+    Each criterion is matched against all remaining jobs at once with Arrow's
+    (RE2-based) string kernels instead of job by job in Python.
 
     Args:
         job_data (list): A list of dictionaries, where each dictionary represents a job posting.
@@ -14,64 +60,41 @@ def filter_jobs(job_data, criteria):
     Returns:
         list: A list of job dictionaries that match all the specified criteria.
     """
-    filtered_jobs = []
-
-    for job in job_data:
-        # 1. Location Filter
-        location_match = False
-        if 'location_preferences' in criteria and criteria['location_preferences']:
-            for pref_loc in criteria['location_preferences']:
-                if pref_loc.lower() in job.get('location', '').lower():
-                    location_match = True
-                    break
-        else:
-            location_match = True # No location criteria, so it's a match
-
-        if not location_match:
-            continue
-
-        # 2. Job Duration Filter
-        duration_match = False
-        if 'job_duration' in criteria and criteria['job_duration']:
-            if criteria['job_duration'].lower() in job.get('job_duration', '').lower():
-                duration_match = True
-        else:
-            duration_match = True # No duration criteria, so it's a match
-
-        if not duration_match:
-            continue
+    location_prefs = criteria.get('location_preferences')
+    job_duration = criteria.get('job_duration')
+    tech_keywords = criteria.get('technologies_keywords')
+    languages = criteria.get('preferred_languages')
+
+    # Criteria are applied cheapest first, each one only to the jobs left by the previous ones
+    jobs = list(job_data)
+
+    # 1. Location Filter
+    if location_prefs and jobs:
+        mask = pc.match_substring_regex(_field_array(jobs, 'location'), pattern=_alternation(location_prefs), ignore_case=True)
+        jobs = _compress(jobs, mask)
+
+    # 2. Job Duration Filter
+    if job_duration and jobs:
+        mask = pc.match_substring(_field_array(jobs, 'job_duration'), pattern=job_duration, ignore_case=True)
+        jobs = _compress(jobs, mask)
+
+    if (tech_keywords or languages) and jobs:
+        description_skills = _field_array(jobs, 'description', 'skills')
+        mask = None
 
         # 3. Technologies/Keywords Filter
-        tech_keyword_match = False
-        if 'technologies_keywords' in criteria and criteria['technologies_keywords']:
-            description_skills = (job.get('description', '') + ' ' + job.get('skills', '')).lower()
-            for keyword in criteria['technologies_keywords']:
-                # Use regex for flexible matching (e.g., "Python" should match "python", "Pythonic", etc.)
-                if re.search(r'\b' + re.escape(keyword.lower()) + r'\w*', description_skills):
-                    tech_keyword_match = True
-                    break
-        else:
-            tech_keyword_match = True # No tech/keyword criteria, so it's a match
-
-        if not tech_keyword_match:
-            continue
+        # Use regex for flexible matching (e.g., "Python" should match "python", "Pythonic", etc.)
+        if tech_keywords:
+            mask = pc.match_substring_regex(description_skills, pattern=_keywords_regex(tech_keywords), ignore_case=True)
 
         # 4. Preferred Languages Filter
-        language_match = False
-        if 'preferred_languages' in criteria and criteria['preferred_languages']:
-            description_skills = (job.get('description', '') + ' ' + job.get('skills', '')).lower()
-            for lang in criteria['preferred_languages']:
-                # Use regex for flexible matching
-                if re.search(r'\b' + re.escape(lang.lower()) + r'\b', description_skills):
-                    language_match = True
-                    break
-        else:
-            language_match = True # No language criteria, so it's a match
-
-        if language_match:
-            filtered_jobs.append(job)
-
-    return filtered_jobs
+        if languages:
+            language_mask = pc.match_substring_regex(description_skills, pattern=_languages_regex(languages), ignore_case=True)
+            mask = language_mask if mask is None else pc.and_(mask, language_mask)
+
+        jobs = _compress(jobs, mask)
+
+    return jobs
 
 if __name__ == '__main__':
     # Example Usage:
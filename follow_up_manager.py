@@ -1,13 +1,61 @@
 import asyncio
 import datetime
 from supabase import Client
-from email_sender import send_application_email
+from email_sender import send_application_emails
 from database import get_supabase_client # Assuming get_supabase_client is needed for testing or direct use
 
+def _follow_up_email(app, jobs_by_id, users_by_id):
+    """
+    Builds the follow-up email of one application, in the format of send_application_emails.
+
+    Returns:
+        dict: The email's arguments, or None if its job or user couldn't be retrieved.
+    """
+    application_id = app['id']
+    job_id = app['job_id']
+    user_id = app['user_id']
+
+    job_details = jobs_by_id.get(job_id)
+
+    if not job_details:
+        print(f"Could not retrieve job details for job_id {job_id}. Skipping application {application_id}.")
+        return None
+
+    job_title = job_details['title']
+    company_name = job_details['company_name']
+
+    user_email_data = users_by_id.get(user_id)
+
+    if not user_email_data:
+        print(f"Could not retrieve user email for user_id {user_id}. Skipping application {application_id}.")
+        return None
+    
+    recipient_email = user_email_data['email']
+
+    # 3. Construct a generic follow-up email message
+    follow_up_subject = f"Following up on my application for {job_title} at {company_name}"
+    follow_up_body = (
+        f"Dear Hiring Manager,\n\n"
+        f"I hope this email finds you well. I am writing to follow up on my application for the "
+        f"{job_title} position at {company_name}, which I submitted on {app['application_date']}.\n\n"
+        f"I remain very interested in this opportunity and believe my skills and experience align well with the requirements of this role.\n\n"
+        f"Thank you for your time and consideration. I look forward to hearing from you soon.\n\n"
+        f"Sincerely,\n[Your Name]" # Placeholder for actual user name
+    )
+
+    return {
+        "recipient_email": recipient_email,
+        "job_title": job_title,
+        "company_name": company_name,
+        "cover_letter_text": follow_up_body, # Using the follow-up body as cover_letter_text
+        "cv_path": None # No CV for follow-up
+    }
+
 async def send_follow_up_emails(client: Client, days_since_application: int = 7):
     """
     Fetches applications with 'sent' status older than days_since_application,
     sends follow-up emails, and updates their status to 'followed_up'.
+    All the emails are sent over one SMTP connection.
 
     Args:
         client (Client): The Supabase client instance.
@@ -16,13 +64,14 @@ async def send_follow_up_emails(client: Client, days_since_application: int = 7)
     Returns:
         list: A list of application IDs for which follow-up emails were sent.
     """
-    followed_up_application_ids = []
-    
     # Calculate the date threshold
     date_threshold = (datetime.date.today() - datetime.timedelta(days=days_since_application)).isoformat()
 
     # 1. Fetch applications
-    response = await client.table('applications').select('*').eq('status', 'sent').lt('application_date', date_threshold).execute()
+    # The client is synchronous; its requests run in worker threads so the event loop stays free
+    response = await asyncio.to_thread(
+        client.table('applications').select('*').eq('status', 'sent').lt('application_date', date_threshold).execute
+    )
     applications_to_follow_up = response.data
 
     if not applications_to_follow_up:
@@ -31,65 +80,48 @@ async def send_follow_up_emails(client: Client, days_since_application: int = 7)
 
     print(f"Found {len(applications_to_follow_up)} applications to follow up.")
 
+    # 2. Retrieve the associated jobs and user emails with one query each
+    job_ids = list({app['job_id'] for app in applications_to_follow_up})
+    user_ids = list({app['user_id'] for app in applications_to_follow_up})
+    jobs_response, users_response = await asyncio.gather(
+        asyncio.to_thread(client.table('jobs').select('id, title, company_name').in_('id', job_ids).execute),
+        asyncio.to_thread(client.table('users').select('id, email').in_('id', user_ids).execute),
+    )
+    jobs_by_id = {job['id']: job for job in jobs_response.data}
+    users_by_id = {user['id']: user for user in users_response.data}
+
+    follow_ups = []
     for app in applications_to_follow_up:
-        application_id = app['id']
-        job_id = app['job_id']
-        user_id = app['user_id']
-
-        # 2. Retrieve associated job details
-        job_response = await client.table('jobs').select('title, company_name').eq('id', job_id).single().execute()
-        job_details = job_response.data
-
-        if not job_details:
-            print(f"Could not retrieve job details for job_id {job_id}. Skipping application {application_id}.")
-            continue
-
-        job_title = job_details['title']
-        company_name = job_details['company_name']
-
-        # Retrieve user email
-        user_response = await client.table('users').select('email').eq('id', user_id).single().execute()
-        user_email_data = user_response.data
-
-        if not user_email_data:
-            print(f"Could not retrieve user email for user_id {user_id}. Skipping application {application_id}.")
-            continue
-        
-        recipient_email = user_email_data['email']
-
-        # 3. Construct a generic follow-up email message
-        follow_up_subject = f"Following up on my application for {job_title} at {company_name}"
-        follow_up_body = (
-            f"Dear Hiring Manager,\n\n"
-            f"I hope this email finds you well. I am writing to follow up on my application for the "
-            f"{job_title} position at {company_name}, which I submitted on {app['application_date']}.\n\n"
-            f"I remain very interested in this opportunity and believe my skills and experience align well with the requirements of this role.\n\n"
-            f"Thank you for your time and consideration. I look forward to hearing from you soon.\n\n"
-            f"Sincerely,\n[Your Name]" # Placeholder for actual user name
-        )
+        email = _follow_up_email(app, jobs_by_id, users_by_id)
+        if email is not None:
+            follow_ups.append((app['id'], email))
+
+    # 4. Send every follow-up email over a single SMTP connection
+    print(f"Sending {len(follow_ups)} follow-up emails...")
+    results = await send_application_emails([email for _, email in follow_ups])
+
+    sent_application_ids = []
+    for (application_id, email), sent in zip(follow_ups, results):
+        if sent:
+            print(f"Follow-up email sent successfully for application {application_id} to {email['recipient_email']}.")
+            sent_application_ids.append(application_id)
+        else:
+            print(f"Failed to send follow-up email for application {application_id}.")
+
+    if not sent_application_ids:
+        return []
 
-        # 4. Use the send_application_email function
-        print(f"Sending follow-up email for application {application_id} to {recipient_email}...")
-        email_sent_successfully = await send_application_email(
-            recipient_email=recipient_email,
-            job_title=job_title,
-            company_name=company_name,
-            cover_letter_text=follow_up_body, # Using the follow-up body as cover_letter_text
-            cv_path=None # No CV for follow-up
+    # 5. Update the status of every followed-up application in one query
+    try:
+        update_response = await asyncio.to_thread(
+            client.table('applications').update({'status': 'followed_up'}).in_('id', sent_application_ids).execute
         )
+    except Exception as e:
+        print(f"Error updating status for applications {sent_application_ids}: {e}")
+        return []
 
-        if email_sent_successfully:
-            print(f"Follow-up email sent successfully for application {application_id}.")
-            # 5. Update the status of the application
-            update_response = await client.table('applications').update({'status': 'followed_up'}).eq('id', application_id).execute()
-            if update_response.data:
-                print(f"Application {application_id} status updated to 'followed_up'.")
-                followed_up_application_ids.append(application_id)
-            elif update_response.error:
-                print(f"Error updating status for application {application_id}: {update_response.error}")
-        else:
-            print(f"Failed to send follow-up email for application {application_id}.")
-    
+    followed_up_application_ids = [row['id'] for row in update_response.data]
+    print(f"Applications {followed_up_application_ids} status updated to 'followed_up'.")
     return followed_up_application_ids
 
 if __name__ == "__main__":
@@ -1,23 +1,79 @@
-import re
-from collections import Counter
-from ai_matcher import preprocess_text # Reusing preprocess_text from ai_matcher.py
-import nltk
-
-# Ensure NLTK stop words are downloaded if not already
-try:
-    nltk.data.find('corpora/stopwords')
-except nltk.downloader.DownloadError:
-    nltk.download('stopwords')
-try:
-    nltk.data.find('tokenizers/punkt')
-except nltk.downloader.DownloadError:
-    nltk.download('punkt')
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from ai_matcher import get_stopwords # Reusing the stop words of ai_matcher.py (downloaded on first use)
+
+# Same cleaning as ai_matcher.preprocess_text: only letters and whitespace are kept
+_NON_LETTER_PATTERN = r'[^a-z\s]'
+
+# Arrow value set of the tokens never counted (stop words and the empty string), set once per process
+_EXCLUDED_TOKENS = None
+
+def _init_worker(stopwords):
+    """
+    Initializer of the analysis worker processes: receives the stop words loaded by the parent,
+    so the workers never import or download them again.
+    """
+    global _EXCLUDED_TOKENS
+    _EXCLUDED_TOKENS = pa.array(list(stopwords) + [''], type=pa.string())
+
+def _excluded_tokens():
+    """
+    Returns the value set of the tokens never counted, built from get_stopwords() on first use
+    when this process didn't receive it through _init_worker.
+    """
+    if _EXCLUDED_TOKENS is None:
+        _init_worker(sorted(get_stopwords()))
+    return _EXCLUDED_TOKENS
+
+# Number of jobs fetched and analyzed at a time
+JOBS_PAGE_SIZE = 1000
+
+def _count_tokens(jobs_page):
+    """
+    Counts the keywords of a page of jobs, in their descriptions and skills.
+
+    Tokenization, lowercasing and stop word removal run as Arrow compute kernels,
+    so every text is processed in C++ instead of a Python loop per token.
+
+    Returns:
+        pyarrow.Table: The keywords of the page ('values') and their occurrences ('counts').
+    """
+    # Descriptions and skills are tokenized as separate strings rather than
+    # concatenated into one new string per job
+    descriptions = [job.get('description') for job in jobs_page]
+    skills = []
+    for job in jobs_page:
+        job_skills = job.get('skills') # Assuming skills are stored as a string or list of strings
+        if isinstance(job_skills, list):
+            skills.extend(job_skills)
+        else:
+            skills.append(job_skills)
+
+    texts = pa.chunked_array([pa.array(descriptions, type=pa.string()), pa.array(skills, type=pa.string())])
+    cleaned = pc.replace_substring_regex(pc.utf8_lower(texts), pattern=_NON_LETTER_PATTERN, replacement='')
+    tokens = pc.list_flatten(pc.utf8_split_whitespace(cleaned))
+    tokens = pc.filter(tokens, pc.invert(pc.is_in(tokens, value_set=_excluded_tokens())))
+
+    return pa.Table.from_struct_array(pc.value_counts(tokens))
+
+def _merge_counts(counts_tables):
+    """
+    Sums the keyword counts of several tables returned by _count_tokens.
+    The aggregation runs in Arrow, without creating a Python object per keyword.
+    """
+    merged = pa.concat_tables(counts_tables).group_by('values').aggregate([('counts', 'sum')])
+    return merged.rename_columns(['values', 'counts'])
 
 def analyze_demanded_technologies(client, num_top_technologies=10):
     """
     Analyzes job descriptions and skills from the 'jobs' table to identify
     the most demanded technologies.
 
+    Jobs are fetched JOBS_PAGE_SIZE at a time and each page is analyzed in a worker process
+    while the next one is fetched. Only the keyword counts of each page are kept, not its rows.
+
     Args:
         client: The Supabase client instance.
         num_top_technologies (int): The number of top technologies to return.
@@ -25,39 +81,44 @@ def analyze_demanded_technologies(client, num_top_technologies=10):
     Returns:
         list: A list of tuples, where each tuple contains (technology_keyword, count).
     """
-    # 1. Fetch all job descriptions and skills from the `jobs` table
-    response = client.from_('jobs').select('description, skills').execute()
-    jobs_data = response.data
+    page_counts = []
+    # The stop words are loaded once here and handed to every worker process
+    with ProcessPoolExecutor(initializer=_init_worker, initargs=(sorted(get_stopwords()),)) as executor:
+        offset = 0
+        while True:
+            # 1. Fetch a page of job descriptions and skills from the `jobs` table
+            response = client.from_('jobs').select('description, skills') \
+                .order('id') \
+                .range(offset, offset + JOBS_PAGE_SIZE - 1) \
+                .execute()
+            jobs_page = response.data
+            if not jobs_page:
+                break
 
-    if not jobs_data:
-        return []
+            # 2. Counts the frequency of each technology keyword.
+            page_counts.append(executor.submit(_count_tokens, jobs_page))
 
-    combined_texts = []
-    for job in jobs_data:
-        description = job.get('description', '')
-        skills = job.get('skills', '') # Assuming skills are stored as a string or list of strings
+            if len(jobs_page) < JOBS_PAGE_SIZE:
+                break
+            offset += JOBS_PAGE_SIZE
 
-        # 3. Combines the text from job descriptions and extracted skills for each job.
-        # If skills is a list, join them into a string
-        if isinstance(skills, list):
-            combined_text = f"{description} {' '.join(skills)}"
-        else:
-            combined_text = f"{description} {skills}"
-        combined_texts.append(combined_text)
+        if not page_counts:
+            return []
+        technology_counts = _merge_counts([future.result() for future in page_counts])
 
-    all_processed_tokens = []
-    for text in combined_texts:
-        # 4. Performs text analysis (e.g., tokenization, lowercasing, removing stop words)
-        #    to identify individual technology keywords.
-        processed_text = preprocess_text(text)
-        all_processed_tokens.extend(processed_text.split())
-
-    # 5. Counts the frequency of each technology keyword.
-    technology_counts = Counter(all_processed_tokens)
+    num_top = min(num_top_technologies, technology_counts.num_rows)
+    if num_top <= 0:
+        return []
 
-    # 6. Returns a list of the top `num_top_technologies` most demanded technologies,
+    # 3. Returns a list of the top `num_top_technologies` most demanded technologies,
     #    along with their counts.
-    return technology_counts.most_common(num_top_technologies)
+    #    Only the top entries are selected (np.argpartition is linear) and sorted,
+    #    not the whole vocabulary.
+    counts = technology_counts['counts'].to_numpy()
+    top = np.argpartition(-counts, num_top - 1)[:num_top]
+    top = top[np.argsort(-counts[top], kind='stable')]
+    keywords = technology_counts['values'].take(pa.array(top)).to_pylist()
+    return list(zip(keywords, counts[top].tolist()))
 
 if __name__ == '__main__':
     # This is a placeholder for a Supabase client.
@@ -71,18 +132,28 @@ if __name__ == '__main__':
             self.columns = columns
             return self
 
+        def order(self, column):
+            return self
+
+        def range(self, start, end):
+            self.start, self.end = start, end
+            return self
+
         def execute(self):
             # Mock data for demonstration
-            return {
-                "data": [
-                    {"description": "Looking for a Python developer with Django and React experience.", "skills": ["Python", "Django", "React", "SQL"]},
-                    {"description": "Frontend engineer needed, strong in JavaScript, HTML, CSS, and Vue.js.", "skills": ["JavaScript", "HTML", "CSS", "Vue.js"]},
-                    {"description": "Data Scientist with Python, R, and machine learning expertise.", "skills": ["Python", "R", "Machine Learning", "TensorFlow"]},
-                    {"description": "DevOps engineer with AWS, Docker, and Kubernetes skills.", "skills": ["AWS", "Docker", "Kubernetes", "CI/CD"]},
-                    {"description": "Fullstack developer, proficient in Node.js, Express, and MongoDB.", "skills": ["Node.js", "Express", "MongoDB", "JavaScript"]},
-                    {"description": "Seeking a Python developer for backend services.", "skills": ["Python", "Flask"]},
-                ]
-            }
+            class MockResponse:
+                pass
+
+            response = MockResponse()
+            response.data = [
+                {"description": "Looking for a Python developer with Django and React experience.", "skills": ["Python", "Django", "React", "SQL"]},
+                {"description": "Frontend engineer needed, strong in JavaScript, HTML, CSS, and Vue.js.", "skills": ["JavaScript", "HTML", "CSS", "Vue.js"]},
+                {"description": "Data Scientist with Python, R, and machine learning expertise.", "skills": ["Python", "R", "Machine Learning", "TensorFlow"]},
+                {"description": "DevOps engineer with AWS, Docker, and Kubernetes skills.", "skills": ["AWS", "Docker", "Kubernetes", "CI/CD"]},
+                {"description": "Fullstack developer, proficient in Node.js, Express, and MongoDB.", "skills": ["Node.js", "Express", "MongoDB", "JavaScript"]},
+                {"description": "Seeking a Python developer for backend services.", "skills": ["Python", "Flask"]},
+            ][self.start:self.end + 1]
+            return response
 
     mock_client = MockSupabaseClient()
     top_technologies = analyze_demanded_technologies(mock_client, num_top_technologies=5)
@@ -1,4 +1,5 @@
 import asyncio
+import logging
 from database import get_supabase_client, initialize_database
 
 async def main():
@@ -16,4 +17,6 @@ async def main():
         print(f"An error occurred during database migration: {e}")
 
 if __name__ == "__main__":
+    # Show the table creation SQL logged by database.py
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main())
\ No newline at end of file
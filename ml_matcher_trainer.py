@@ -1,11 +1,32 @@
 import asyncio
+import os
 import joblib
+import numpy as np
 import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
 from sklearn.linear_model import LogisticRegression
 from sklearn.model_selection import train_test_split
+from sklearn.pipeline import Pipeline
 from database import get_supabase_client # Assuming database.py has get_supabase_client
 
+# Trained artifacts are kept in the (git-ignored) cache directory
+MODEL_PATH = os.path.join('cache', 'job_matching_model.joblib')
+VECTORIZER_PATH = os.path.join('cache', 'tfidf_vectorizer.joblib')
+
+def _combined_features(jobs_df):
+    """
+    Combines each job's description and skills into one text column.
+    Skills stored as lists are joined with pandas' vectorized string methods
+    rather than a Python lambda per row.
+    """
+    # Cast to object first: a column with only missing values has a float dtype,
+    # on which the .str accessor raises
+    skills = jobs_df['skills'].astype(object)
+    is_list = skills.map(type).eq(list)
+    skills_text = skills.where(~is_list, skills[is_list].str.join(' '))
+    descriptions = jobs_df['description'].astype(object).fillna('')
+    return descriptions.str.cat(skills_text.fillna('').astype(str), sep=' ')
+
 async def train_matching_model(client):
     """
     Trains a machine learning model on historical job and application data
@@ -17,108 +38,76 @@ async def train_matching_model(client):
     Returns:
         str: The path to the saved model.
     """
-    # 1. Fetch historical job data
-    jobs_response = await client.from_('jobs').select('description, skills').execute()
-    jobs_data = jobs_response.data
-
-    # 2. Fetch application data
-    applications_response = await client.from_('applications').select('job_id, status, relevance_score').execute()
-    applications_data = applications_response.data
-
-    if not jobs_data or not applications_data:
+    # 1. Fetch application data joined with its job by PostgREST (jobs is embedded through
+    #    the applications.job_id foreign key), so no jobs table transfer or pandas merge is needed
+    response = await asyncio.to_thread(
+        client.from_('applications').select('status, jobs!inner(description, skills)').execute
+    )
+    applications_data = response.data
+
+    if not applications_data:
         print("Not enough data to train the model.")
         return None
 
-    jobs_df = pd.DataFrame(jobs_data)
-    applications_df = pd.DataFrame(applications_data)
+    merged_df = pd.json_normalize(applications_data).rename(
+        columns={'jobs.description': 'description', 'jobs.skills': 'skills'}
+    )
 
     # Preprocessing: Combine job description and skills
-    jobs_df['combined_features'] = jobs_df['description'] + ' ' + jobs_df['skills'].apply(lambda x: ' '.join(x) if isinstance(x, list) else x)
-
-    # Merge dataframes
-    # Assuming 'job_id' exists in applications_df and can be used to link to jobs_df
-    # For now, let's assume we can link applications to job descriptions directly for simplicity
-    # In a real scenario, you'd need to join on a common job identifier.
-    # For this example, we'll create a dummy merge or assume applications_df already has job details
-    # Let's simplify and assume applications_df has a 'job_description' and 'job_skills' for now
-    # This part needs refinement based on actual schema.
-    # For now, let's create a simplified dataset for training.
-
-    # For demonstration, let's create a dummy combined feature for applications
-    # In a real scenario, you'd join applications with jobs on job_id
-    # and then use the job's combined_features.
-    # Since we don't have job_id in jobs_df from the select, let's assume a direct link for now.
-    # This is a placeholder and needs to be adjusted based on the actual Supabase schema.
-
-    # Let's assume a simplified scenario where we are training on job descriptions
-    # and predicting a relevance score.
-    # This will require a proper join operation.
-
-    # Placeholder for actual data preparation
-    # For now, let's create a dummy dataset for demonstration purposes
-    # In a real scenario, you would join applications_df with jobs_df on a common ID.
-    # For this example, we'll use a simplified approach.
-
-    # Let's assume 'applications_df' has a 'job_description' column for simplicity
-    # and 'relevance_score' as the target.
-    # If 'relevance_score' is not available, we'd derive it from 'status'.
-
-    # Example of deriving target variable if relevance_score is not present
-    if 'relevance_score' not in applications_df.columns:
-        applications_df['relevance_score'] = applications_df['status'].apply(
-            lambda x: 1 if x in ['interview', 'accepted'] else 0
-        )
-
-    # For now, let's use job descriptions from jobs_df and a dummy target
-    # This needs to be properly linked with applications.
-    # Let's assume a simplified scenario where we train on job descriptions
-    # and predict a binary outcome based on application status.
-
-    # To properly link, we need a common identifier.
-    # Let's assume 'jobs' table has an 'id' and 'applications' table has a 'job_id'.
-    # Re-fetching with 'id' for jobs.
-    jobs_response_with_id = await client.from_('jobs').select('id, description, skills').execute()
-    jobs_data_with_id = jobs_response_with_id.data
-    jobs_df_with_id = pd.DataFrame(jobs_data_with_id)
-    jobs_df_with_id['combined_features'] = jobs_df_with_id['description'] + ' ' + jobs_df_with_id['skills'].apply(lambda x: ' '.join(x) if isinstance(x, list) else x)
-
-    # Merge applications with jobs
-    merged_df = pd.merge(applications_df, jobs_df_with_id, left_on='job_id', right_on='id', how='inner')
-
-    if merged_df.empty:
-        print("Merged dataframe is empty. Cannot train model.")
-        return None
+    merged_df['combined_features'] = _combined_features(merged_df)
 
-    # Use combined features from the merged dataframe
+    # Target variable derived from the application status
+    merged_df['relevance_score'] = merged_df['status'].isin(['interview', 'accepted']).astype(int)
+
+    # Use combined features from the joined rows
     X = merged_df['combined_features']
     y = merged_df['relevance_score']
 
-    # TF-IDF Vectorization (reusing logic from ai_matcher.py if available)
-    # For now, we'll create a new TfidfVectorizer.
-    # In a real scenario, you might want to save/load the vectorizer or ensure consistency.
-    vectorizer = TfidfVectorizer(stop_words='english', max_features=5000)
+    # TF-IDF Vectorization. Hashing the terms is a single stateless pass with no vocabulary
+    # held in memory; only the IDF weights of the TfidfTransformer are learned.
+    vectorizer = Pipeline([
+        ('hashing', HashingVectorizer(n_features=2**18, alternate_sign=False, norm=None,
+                                      stop_words='english', dtype=np.float32)),
+        ('tfidf', TfidfTransformer(sublinear_tf=True, norm='l2')),
+    ])
     X_vectorized = vectorizer.fit_transform(X)
 
     # Split data
     X_train, X_test, y_train, y_test = train_test_split(X_vectorized, y, test_size=0.2, random_state=42)
 
-    # Train a simple machine learning model
-    model = LogisticRegression(max_iter=1000)
+    # Train a simple machine learning model. saga works directly on the sparse TF-IDF matrix.
+    model = LogisticRegression(solver='saga', penalty='l2', max_iter=200, tol=1e-3)
     model.fit(X_train, y_train)
 
-    # Save the trained model
-    model_path = 'job_matching_model.joblib'
-    joblib.dump(model, model_path)
-
-    # Save the vectorizer as well, so it can be reused for predictions
-    vectorizer_path = 'tfidf_vectorizer.joblib'
-    joblib.dump(vectorizer, vectorizer_path)
+    # Save the trained model, compressed, and the vectorizer as well, so it can be reused for
+    # predictions. The vectorizer is left uncompressed so load_matching_model can memory-map
+    # its IDF array. Both are written in worker threads so the event loop isn't blocked.
+    model_path = MODEL_PATH
+    vectorizer_path = VECTORIZER_PATH
+    for path in (model_path, vectorizer_path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    await asyncio.gather(
+        asyncio.to_thread(joblib.dump, model, model_path, compress=3, protocol=5),
+        asyncio.to_thread(joblib.dump, vectorizer, vectorizer_path, protocol=5),
+    )
 
     print(f"Model trained and saved to {model_path}")
     print(f"Vectorizer saved to {vectorizer_path}")
 
     return model_path
 
+def load_matching_model(model_path=MODEL_PATH, vectorizer_path=VECTORIZER_PATH):
+    """
+    Loads the model and vectorizer saved by train_matching_model.
+    The vectorizer's arrays are memory-mapped read-only instead of copied into memory.
+
+    Returns:
+        tuple: (model, vectorizer)
+    """
+    model = joblib.load(model_path)
+    vectorizer = joblib.load(vectorizer_path, mmap_mode='r')
+    return model, vectorizer
+
 if __name__ == "__main__":
     async def main():
         client = get_supabase_client()
@@ -1,15 +1,20 @@
 import asyncio
 import os # Import os for environment variables
-from database import get_supabase_client, get_user_profile, save_job_data, update_job_relevance_score, get_unscored_jobs, get_jobs_for_application, save_application_details, update_job_status
-from scraper import scrape_jobs_from_search_page
+from database import get_supabase_client, get_user_profile, save_jobs_bulk, update_job_relevance_scores, get_unscored_jobs, get_jobs_for_application, save_applications_bulk, update_jobs_status, filter_new_application_links, get_job_descriptions
+from scraper import BROWSER_POOL, scrape_jobs_from_search_page
 from filter_jobs import filter_jobs
-from relevance_scorer import calculate_relevance_score
-from application_generator import generate_cover_letter
+from relevance_scorer import calculate_relevance_scores
+from ai_matcher import fit_corpus_vectorizer
+from application_generator import generate_cover_letters_bulk
 from follow_up_manager import send_follow_up_emails
+from duplicate_detector import find_existing_application_job_ids
 from email_sender import send_application_email # Import send_application_email
 
 REPORT_RECIPIENT_EMAIL = os.getenv("REPORT_RECIPIENT_EMAIL")
 
+# Maximum number of cover letters being generated by the LLM at once
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "8"))
+
 async def send_report_email(recipient_email: str, subject: str, body: str):
     """
     Sends a general report email using the send_application_email function.
@@ -30,6 +35,60 @@ async def send_report_email(recipient_email: str, subject: str, body: str):
         print(f"Failed to send report email to {recipient_email}.")
     return success
 
+async def _generate_applications(client, user_id: int, full_user_profile: dict, application_threshold: int) -> int:
+    """
+    Generates and saves the applications of every job meeting the application threshold
+    that the user hasn't applied to yet, then marks these jobs as applied.
+
+    Returns:
+        int: The number of applications generated and saved.
+    """
+    print(f"Identifying jobs for application for user {user_id}...")
+    jobs_to_apply = await get_jobs_for_application(client, application_threshold)
+    applications_generated_count = 0
+
+    # Skip jobs the user already applied to, checked in one query
+    if jobs_to_apply:
+        applied_job_ids = await find_existing_application_job_ids(client, user_id, [job['id'] for job in jobs_to_apply])
+        jobs_to_apply = [job for job in jobs_to_apply if job['id'] not in applied_job_ids]
+
+    if jobs_to_apply:
+        print(f"Found {len(jobs_to_apply)} jobs meeting application criteria (relevance >= {application_threshold}).")
+        for job in jobs_to_apply:
+            print(f"Generating application for job {job.get('id')}: {job.get('title')} at {job.get('company_name')}")
+
+        # Generate every cover letter concurrently, at most LLM_CONCURRENCY requests at a time
+        cover_letters = await generate_cover_letters_bulk(
+            [(job, full_user_profile) for job in jobs_to_apply],
+            concurrency=LLM_CONCURRENCY
+        )
+
+        applications = []
+        for job, cover_letter in zip(jobs_to_apply, cover_letters):
+            if cover_letter and "Failed to generate cover letter" not in cover_letter:
+                applications.append({
+                    "job_id": job['id'],
+                    "user_id": user_id,
+                    "cover_letter_text": cover_letter,
+                    "status": 'generated' # Status 'generated' before actual sending
+                })
+            else:
+                print(f"Skipping application for job {job['id']} due to cover letter generation failure.")
+
+        # Save all application details in one insert, then mark their jobs as applied in one update
+        application_ids = await save_applications_bulk(client, applications)
+        if application_ids:
+            applied_job_ids = [application['job_id'] for application in applications]
+            print(f"Applications generated and saved for jobs {applied_job_ids}. Application IDs: {application_ids}")
+            await update_jobs_status(client, applied_job_ids, 'applied')
+            applications_generated_count = len(application_ids)
+        elif applications:
+            print(f"Failed to save application details for {len(applications)} jobs.")
+    else:
+        print("No jobs found meeting application criteria.")
+
+    return applications_generated_count
+
 async def run_daily_scraping(user_id: int, search_url: str, max_pages: int = 5, relevance_threshold: int = 50):
     """
     Orchestrates the daily job scraping, filtering, and saving process for a specific user.
@@ -78,79 +137,58 @@ async def run_daily_scraping(user_id: int, search_url: str, max_pages: int = 5,
     jobs_filtered_count = len(filtered_jobs)
     print(f"Filtered down to {jobs_filtered_count} relevant jobs.")
 
-    relevant_jobs_found = 0
-    # 4. Calculate relevance score and save each filtered job
-    for job in filtered_jobs:
-        print(f"Processing job: {job.get('title')} at {job.get('company_name')}")
-        
-        # Calculate relevance score
-        score = calculate_relevance_score(job, profile_text)
-        job['relevance_score'] = score
+    # Jobs already saved by a previous run are dropped before scoring, with one lookup of their links
+    new_links = set(await filter_new_application_links(
+        client, [job['application_link'] for job in filtered_jobs if job.get('application_link')]
+    ))
+    filtered_jobs = [job for job in filtered_jobs if job.get('application_link') in new_links]
+    print(f"{len(filtered_jobs)} of them are not saved yet.")
 
-        # Save job data
-        # Assuming save_job_data returns the saved job's ID or a similar identifier
-        # and that it handles duplicates based on application_link
-        saved_job_response = save_job_data(client, job)
-        
-        if saved_job_response and saved_job_response.data:
-            job_id = saved_job_response.data[0]['id']
-            print(f"Job saved with ID: {job_id}. Relevance score: {score}")
+    # Refit the corpus-wide TF-IDF model on the saved jobs and the new ones, so every score of this
+    # run (new and previously unscored jobs alike) uses the same vocabulary and IDF weights
+    corpus = await asyncio.to_thread(get_job_descriptions, client)
+    corpus.extend(job.get('description') or '' for job in filtered_jobs)
+    try:
+        await asyncio.to_thread(fit_corpus_vectorizer, corpus)
+    except ValueError as e: # No words to learn from, e.g. no jobs at all yet
+        print(f"Could not fit the corpus TF-IDF model: {e}")
 
-            # Update relevance score (if needed, as it's already in the insert, but for explicit update)
-            await update_job_relevance_score(client, job_id, score)
+    # 4. Calculate the relevance score of every filtered job, then save them all at once
+    #    All descriptions are scored against the profile in one batch
+    scores = calculate_relevance_scores([job.get('description') or '' for job in filtered_jobs], profile_text)
+    for job, score in zip(filtered_jobs, scores.tolist()):
+        print(f"Processing job: {job.get('title')} at {job.get('company_name')}")
+        job['relevance_score'] = score
 
-            if score >= relevance_threshold:
-                relevant_jobs_found += 1
-        else:
-            print(f"Could not save job: {job.get('application_link')}. It might be a duplicate or an error occurred.")
+    # One bulk upsert with the scores included; duplicates based on application_link are ignored
+    saved_jobs = await asyncio.to_thread(save_jobs_bulk, client, filtered_jobs)
+    print(f"Saved {len(saved_jobs)} new jobs ({jobs_filtered_count - len(saved_jobs)} duplicates or errors).")
+    relevant_jobs_found = sum(1 for saved_job in saved_jobs if (saved_job.get('relevance_score') or 0) >= relevance_threshold)
 
     # 5. Score any previously unscored jobs
-    jobs_scored_count = await score_unscored_jobs(user_id, client)
+    jobs_scored_count = await score_unscored_jobs(user_id, client, profile_text)
 
-    # 6. Generate and Save Applications
-    print(f"Identifying jobs for application for user {user_id}...")
-    application_threshold = relevance_threshold + 10 # A higher threshold for applying
-    jobs_to_apply = await get_jobs_for_application(client, application_threshold)
-    applications_generated_count = 0
-
-    if jobs_to_apply:
-        print(f"Found {len(jobs_to_apply)} jobs meeting application criteria (relevance >= {application_threshold}).")
-        for job in jobs_to_apply:
-            job_id = job.get('id')
-            print(f"Generating application for job {job_id}: {job.get('title')} at {job.get('company_name')}")
-            
-            # Generate cover letter
-            cover_letter = await generate_cover_letter(job, full_user_profile)
+    # 6. Start the Follow-up Manager. The follow-up emails are about older applications, so they are
+    #    sent in the background while the new applications are generated, and awaited afterwards.
+    print(f"Checking for eligible applications for follow-up for user {user_id}...")
+    follow_up_task = asyncio.create_task(send_follow_up_emails(client))
 
-            if cover_letter and "Failed to generate cover letter" not in cover_letter:
-                # Save application details
-                application_id = await save_application_details(
-                    client,
-                    job_id=job_id,
-                    cover_letter_text=cover_letter,
-                    user_id=user_id,
-                    status='generated' # Status 'generated' before actual sending
-                )
-                if application_id:
-                    print(f"Application generated and saved for job {job_id}. Application ID: {application_id}")
-                    await update_job_status(client, job_id, 'applied')
-                    applications_generated_count += 1
-                else:
-                    print(f"Failed to save application details for job {job_id}.")
-            else:
-                print(f"Skipping application for job {job_id} due to cover letter generation failure.")
-    else:
-        print("No jobs found meeting application criteria.")
+    # 7. Generate and Save Applications. The follow-up task is always awaited, even if this step
+    #    fails, so no follow-up email is left running unattended.
+    application_threshold = relevance_threshold + 10 # A higher threshold for applying
+    try:
+        applications_generated_count = await _generate_applications(client, user_id, full_user_profile, application_threshold)
+    finally:
+        await asyncio.gather(follow_up_task, return_exceptions=True)
 
-    # 7. Run Follow-up Manager
-    print(f"Checking for eligible applications for follow-up for user {user_id}...")
-    followed_up_application_ids = await send_follow_up_emails(client)
+    # 8. Collect the follow-up emails started in step 6 (re-raises their error, if any)
+    followed_up_application_ids = follow_up_task.result()
     follow_up_emails_sent_count = len(followed_up_application_ids)
     print(f"Sent {follow_up_emails_sent_count} follow-up emails for user {user_id}.")
 
     print(f"Daily scraping and scoring completed for user {user_id}.")
 
-    # 8. Generate and Send Daily Report
+    # 9. Generate and Send Daily Report
     report_message = (
         f"Daily Job Application Report for User {user_id}:\n\n"
         f"Jobs Scraped: {jobs_scraped_count}\n"
@@ -187,19 +225,21 @@ async def run_daily_scraping(user_id: int, search_url: str, max_pages: int = 5,
         "daily_report_sent": report_sent # New field to indicate if report was sent
     }
 
-async def score_unscored_jobs(user_id: int, client):
+async def score_unscored_jobs(user_id: int, client, profile_text: str | None = None):
     """
     Fetches unscored jobs and calculates/updates their relevance scores.
+    The user's profile text is fetched only when the caller doesn't already have it.
     """
     print(f"Starting scoring for unscored jobs for user {user_id}.")
     
-    # 1. Fetch user profile
-    user_profile = await get_user_profile(client, user_id)
-    if not user_profile:
-        print(f"Could not fetch user profile for user_id {user_id}. Aborting scoring.")
-        return 0
-    
-    profile_text = user_profile.get('profile_text', '')
+    # 1. Fetch user profile, unless its text was passed in
+    if profile_text is None:
+        user_profile = await get_user_profile(client, user_id)
+        if not user_profile:
+            print(f"Could not fetch user profile for user_id {user_id}. Aborting scoring.")
+            return 0
+        profile_text = user_profile.get('profile_text', '')
+
     if not profile_text:
         print(f"User profile text is empty for user_id {user_id}. Aborting scoring.")
         return 0
@@ -209,20 +249,21 @@ async def score_unscored_jobs(user_id: int, client):
     jobs_to_score_count = len(unscored_jobs)
     print(f"Found {jobs_to_score_count} unscored jobs to process.")
 
-    jobs_scored_count = 0
-    # 3. Calculate and Store Scores
+    # 3. Calculate the scores of every job with a description, in one batch
+    jobs_to_score = []
     for job in unscored_jobs:
-        job_id = job.get('id')
-        job_description = job.get('description', '')
-        
-        if not job_description:
-            print(f"Job {job_id} has no description, skipping scoring.")
+        if not job.get('description'):
+            print(f"Job {job.get('id')} has no description, skipping scoring.")
             continue
+        print(f"Scoring job {job.get('id')}: {job.get('title')} at {job.get('company_name')}")
+        jobs_to_score.append(job)
 
-        print(f"Scoring job {job_id}: {job.get('title')} at {job.get('company_name')}")
-        score = calculate_relevance_score(job_description, profile_text)
-        await update_job_relevance_score(client, job_id, score)
-        jobs_scored_count += 1
+    scores = calculate_relevance_scores([job['description'] for job in jobs_to_score], profile_text)
+
+    # 4. Store all the scores with a single request
+    jobs_scored_count = await update_job_relevance_scores(
+        client, {job['id']: score for job, score in zip(jobs_to_score, scores.tolist())}
+    )
     
     print(f"Completed scoring for {jobs_scored_count} jobs for user {user_id}.")
     return jobs_scored_count
@@ -234,6 +275,12 @@ if __name__ == "__main__":
     example_search_url = "https://www.linkedin.com/jobs/search/?keywords=software%20engineer"
     
     print(f"Running example daily scraping for user {example_user_id}...")
-    summary = asyncio.run(run_daily_scraping(example_user_id, example_search_url, max_pages=1, relevance_threshold=60))
+    async def main():
+        try:
+            return await run_daily_scraping(example_user_id, example_search_url, max_pages=1, relevance_threshold=60)
+        finally:
+            await BROWSER_POOL.close() # The shared browser is kept open between runs until then
+
+    summary = asyncio.run(main())
     print("\nScraping Summary:")
     print(summary)
\ No newline at end of file
@@ -1,4 +1,5 @@
-from ai_matcher import match_job_to_user
+import numpy as np
+from ai_matcher import match_job_to_user, match_user_to_jobs
 
 def calculate_relevance_score(job_description: str, user_profile_text: str) -> float:
     """
@@ -9,8 +10,30 @@ def calculate_relevance_score(job_description: str, user_profile_text: str) -> f
         user_profile_text (str): The text of the user's profile.
 
     Returns:
-        float: The scaled relevance score between 0 and 100.
+        float: The scaled relevance score between 0 and 100 (0 if either text is empty).
     """
+    if not job_description or not job_description.strip() or not user_profile_text or not user_profile_text.strip():
+        return 0.0
     cosine_similarity = match_job_to_user(job_description, user_profile_text)
     relevance_score = cosine_similarity * 100
-    return relevance_score
\ No newline at end of file
+    return relevance_score
+
+def calculate_relevance_scores(job_descriptions: list[str], user_profile_text: str) -> np.ndarray:
+    """
+    Calculates the relevance scores of many job descriptions against one user profile.
+    The profile and all descriptions are vectorized together and scored with a single
+    matrix product, instead of one calculate_relevance_score call per job.
+
+    Args:
+        job_descriptions (list[str]): The texts of the job descriptions.
+        user_profile_text (str): The text of the user's profile.
+
+    Returns:
+        np.ndarray: The scaled relevance scores between 0 and 100, in the same order as job_descriptions.
+                    Empty descriptions, or an empty profile, score 0.
+    """
+    if not user_profile_text or not user_profile_text.strip():
+        return np.zeros(len(job_descriptions), dtype=np.float32)
+    if not job_descriptions:
+        return np.zeros(0, dtype=np.float32)
+    return match_user_to_jobs(user_profile_text, job_descriptions) * 100
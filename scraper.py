@@ -1,76 +1,456 @@
 import asyncio
-from playwright.async_api import async_playwright, Page
+import calendar
+import contextlib
+import datetime
+import os
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Route, TimeoutError as PlaywrightTimeoutError
+
+# Maximum number of job pages scraped at the same time
+SCRAPE_CONCURRENCY = int(os.getenv("SCRAPE_CONCURRENCY", "10"))
+
+# Selectors tried in order for each field of a job page; the first element with text
+# (or, for links, an href) wins. {"text": ...} entries match links containing that text,
+# like Playwright's a:has-text(), which document.querySelector doesn't support.
+JOB_FIELD_SELECTORS = {
+    "title": ["h1", "div.job-title"],
+    "description": ["div.job-description, section.job-description, div.description, section.description"],
+    # Common selectors for publication date
+    "date": [
+        "span.date-posted", "div.date-posted", "p.date-posted",
+        "span.posted-on", "div.posted-on", "p.posted-on",
+        "span.job-date", "div.job-date", "p.job-date",
+        "[itemprop='datePosted']", # Schema.org common attribute
+        "time" # HTML5 time element
+    ],
+    # Common selectors for company name
+    "company": [
+        "span.company-name", "div.company-name", "a.company-name",
+        "span.employer", "div.employer", "a.employer",
+        "span.hiring-company", "div.hiring-company", "a.hiring-company",
+        "[data-testid='company-name']", # Common attribute in some job boards
+        "a[href*='company']" # Link to company profile
+    ],
+    # Common selectors for location
+    "location": [
+        "span.job-location", "div.job-location", "p.job-location",
+        "span.location", "div.location", "p.location",
+        "span.address", "div.address", "p.address",
+        "[data-testid='job-location']", # Common attribute in some job boards
+    ],
+    # Common selectors and text for direct application links
+    "apply": [
+        "a.apply-button", "a.application-link",
+        {"text": "Apply Now"}, {"text": "Postuler"}, {"text": "Candidater"},
+        "a[href*='apply']", "a[href*='application']"
+    ],
+    # If no direct link, links to the company's application page
+    "company_apply": [
+        "a[href*='careers']", "a[href*='jobs']", "a[href*='hiring']"
+    ],
+}
+
+# Resource types never needed to extract job data; they are aborted instead of downloaded
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
+# Skills looked for in job descriptions
+COMMON_SKILLS = ["Python", "SQL", "JavaScript", "AWS", "Docker", "Kubernetes", "React", "Angular", "Vue.js", "Node.js", "TypeScript", "Java", "C#", "Go", "Rust", "Azure", "GCP", "Terraform", "Ansible", "Git", "CI/CD", "Agile", "Scrum", "Linux", "Bash", "Data Science", "Machine Learning", "Deep Learning", "Pandas", "NumPy", "Scikit-learn", "TensorFlow", "PyTorch", "Spark", "Hadoop", "Kafka", "MongoDB", "PostgreSQL", "MySQL", "Redis", "GraphQL", "REST API", "Microservices", "Frontend", "Backend", "Fullstack", "DevOps", "Cloud", "Security", "Networking", "Blockchain", "AI", "NLP", "Computer Vision"]
+
+# Every skill matched in a single scan of the description, as a whole word (case-insensitive).
+# Longer names come first so that e.g. "JavaScript" isn't matched as "Java".
+_SKILL_NAMES = {skill.lower(): skill for skill in COMMON_SKILLS}
+SKILL_RE = re.compile(
+    r'(?<!\w)(' + '|'.join(map(re.escape, sorted(COMMON_SKILLS, key=len, reverse=True))) + r')(?!\w)',
+    re.IGNORECASE
+)
+
+# Query parameters added by job boards and campaigns for tracking; they don't change the job page
+_TRACKING_PARAMS = {"trk", "trackingid", "refid", "ref", "src", "fbclid", "gclid"}
+
+# Common selectors for job links on a search results page, combined into one selector
+# so the page is queried once for all of them
+JOB_LINK_SELECTOR = ", ".join([
+    "a.job-card-link", "a.job-listing-link", "a[data-testid='job-result']",
+    "div.job-result-card a", "li.job-item a"
+])
+
+# Common selectors for the "next page" button of a search results page, tried in order.
+# {"text": ...} entries match links containing that text, as in JOB_FIELD_SELECTORS.
+NEXT_PAGE_SELECTORS = [
+    "a.next-page", "button.pagination-next", "a[aria-label='Next']",
+    {"text": "Next"}, {"text": "Suivant"}
+]
+
+# Finds the "next page" button (returned as an element handle), or null when there is none
+_NEXT_PAGE_JS = """
+(selectors) => {
+    const find = (selector) => typeof selector === 'string'
+        ? document.querySelector(selector)
+        : [...document.querySelectorAll('a')].find(
+            (a) => a.textContent.toLowerCase().includes(selector.text.toLowerCase()));
+    for (const selector of selectors) {
+        const element = find(selector);
+        if (element) return element;
+    }
+    return null;
+}
+"""
+
+# Reads the link and disabled state of the "next page" button in one call
+_NEXT_PAGE_STATE_JS = """
+(element) => {
+    const href = element.getAttribute('href');
+    return {
+        // Only real links can be followed with page.goto; '#' and javascript: links need a click
+        href: href && !href.startsWith('#') && !href.startsWith('javascript:') ? element.href : null,
+        disabled: Boolean(element.disabled) || element.getAttribute('aria-disabled') === 'true',
+    };
+}
+"""
+
+# How long a results page may take to show its first job link, in milliseconds
+RESULTS_TIMEOUT_MS = 10_000
+
+# Query parameters holding the page number of a search results URL
+_PAGE_NUMBER_PARAMS = {"page", "p", "pg", "pagenum"}
+
+# English month names and abbreviations, as accepted by strptime's %B and %b
+_MONTHS = {
+    name.lower(): number
+    for number in range(1, 13)
+    for name in (calendar.month_name[number], calendar.month_abbr[number])
+}
+
+# The common non-ISO publication date formats in one pattern, each alternative with its own groups:
+# "March 5, 2024", "5 March 2024", "2024/03/05", "03/05/2024" (month first) and "05-03-2024" (day first, as on French boards)
+_DATE_RE = re.compile(r"""
+    (?P<name_md>[a-z]+)\s+(?P<day_md>\d{1,2}),\s*(?P<year_md>\d{4})
+  | (?P<day_dm>\d{1,2})\s+(?P<name_dm>[a-z]+)\s+(?P<year_dm>\d{4})
+  | (?P<year_ymd>\d{4})/(?P<month_ymd>\d{1,2})/(?P<day_ymd>\d{1,2})
+  | (?P<month_mdy>\d{1,2})/(?P<day_mdy>\d{1,2})/(?P<year_mdy>\d{4})
+  | (?P<day_dmy>\d{1,2})-(?P<month_dmy>\d{1,2})-(?P<year_dmy>\d{4})
+""", re.IGNORECASE | re.VERBOSE)
+
+# Leading 'YYYY-MM-DD' of an ISO 8601 date or datetime
+_ISO_DATE_RE = re.compile(r'\s*(\d{4}-\d{2}-\d{2})(?![\d])')
+
+# Runs every selector chain inside the page, so a job page costs one round-trip to the browser
+_JOB_FIELDS_JS = """
+(cfg) => {
+    const find = (selector) => typeof selector === 'string'
+        ? document.querySelector(selector)
+        : [...document.querySelectorAll('a')].find(
+            (a) => a.textContent.toLowerCase().includes(selector.text.toLowerCase()));
+    const pickText = (selectors) => {
+        for (const selector of selectors) {
+            const element = find(selector);
+            if (element && element.textContent) return element.textContent;
+        }
+        return null;
+    };
+    const pickHref = (selectors) => {
+        for (const selector of selectors) {
+            const element = find(selector);
+            const href = element && element.getAttribute('href');
+            if (href) return href;
+        }
+        return null;
+    };
+    // A <time datetime="..."> attribute is machine-readable, so it is preferred to any visible text
+    const time = document.querySelector('time[datetime]');
+    return {
+        title: pickText(cfg.title),
+        description: pickText(cfg.description),
+        date: (time && time.getAttribute('datetime')) || pickText(cfg.date),
+        company_name: pickText(cfg.company),
+        location: pickText(cfg.location),
+        application_link: pickHref(cfg.apply) || pickHref(cfg.company_apply),
+    };
+}
+"""
+
+async def _block_unneeded_resources(route: Route):
+    """
+    Aborts the requests of BLOCKED_RESOURCE_TYPES and lets every other request through.
+    """
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
 
-async def get_job_title(url: str, page: Page | None = None) -> str | None:
+async def _new_context(browser: Browser) -> BrowserContext:
     """
-    Navigates to a given URL using Playwright and extracts the job title.
-    Assumes the job title is within an <h1> tag or a <div> with class 'job-title'.
-    If a page object is provided, it uses the existing page; otherwise, it launches a new browser and page.
+    Opens a browser context whose pages don't download images, fonts, media or stylesheets.
+    """
+    context = await browser.new_context()
+    await context.route("**/*", _block_unneeded_resources)
+    return context
+
+class BrowserPool:
+    """
+    One Chromium browser, launched on first use and shared by every scrape,
+    with a pool of reusable browser contexts. At most `size` contexts are in use at once.
+    Reusing them keeps the browser's HTTP cache and cookies warm between jobs and runs.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._loop = None
+        self._lock = None
+        self._relaunch = True
+        self._playwright = None
+        self._browser = None
+        self._idle_contexts = None
+        self._slots = None
+        # Slots of the launch each checked-out context was created by
+        self._context_slots = {}
+
+    async def _shutdown(self):
+        """
+        Closes the current browser and stops the current Playwright driver, if any.
+        Best effort: handles left from another event loop may not close cleanly.
+        """
+        browser, playwright = self._browser, self._playwright
+        self._browser = self._playwright = None
+        for close in (browser and browser.close, playwright and playwright.stop):
+            if close:
+                try:
+                    await asyncio.wait_for(close(), timeout=5)
+                except Exception as e:
+                    print(f"Error shutting down the previous browser: {e}")
+
+    async def _start(self):
+        # A relaunch replaces the previous browser, which must not be left running
+        await self._shutdown()
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch()
+        # New slots, so that contexts still checked out from the previous browser are told apart
+        self._idle_contexts = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.size)
+
+    async def get_browser(self) -> Browser:
+        """
+        Returns the shared browser, launching it on first use
+        (and again if the event loop changed or the browser disconnected).
+        Launches are serialized, so concurrent callers share a single relaunch.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # The lock and the browser's handles belong to the event loop they were created in
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._relaunch = True
+        async with self._lock:
+            if self._relaunch or self._browser is None or not self._browser.is_connected():
+                await self._start()
+                self._relaunch = False
+            return self._browser
+
+    async def acquire(self) -> BrowserContext:
+        """
+        Waits for a free slot and returns an idle context, or a new one if none is idle.
+        """
+        while True:
+            browser = await self.get_browser()
+            slots, idle_contexts = self._slots, self._idle_contexts
+            await slots.acquire()
+            if slots is self._slots:
+                break
+            slots.release() # The browser was relaunched while waiting, try again with the new one
+        try:
+            context = idle_contexts.get_nowait()
+        except asyncio.QueueEmpty:
+            try:
+                context = await _new_context(browser)
+            except Exception:
+                slots.release()
+                raise
+        self._context_slots[context] = slots
+        return context
+
+    async def release(self, context: BrowserContext):
+        """
+        Gives a context back to the pool, with its pages closed so the next user starts clean.
+        A context of a browser that has since been relaunched is closed instead, and its slot
+        given back to that browser's slots (waking callers still waiting on them to try again).
+        """
+        slots = self._context_slots.pop(context, None)
+        if slots is not self._slots:
+            try:
+                await context.close()
+            except Exception as e:
+                print(f"Error closing stale browser context: {e}")
+            finally:
+                if slots:
+                    slots.release()
+            return
+        try:
+            for page in context.pages:
+                await page.close()
+            self._idle_contexts.put_nowait(context)
+        except Exception as e:
+            print(f"Discarding browser context: {e}")
+        finally:
+            self._slots.release()
+
+    @contextlib.asynccontextmanager
+    async def context(self):
+        """
+        Acquires a context for the duration of an `async with` block.
+        """
+        context = await self.acquire()
+        try:
+            yield context
+        finally:
+            await self.release(context)
+
+    async def close(self):
+        """
+        Closes the browser and stops Playwright. The next scrape launches them again.
+        """
+        await self._shutdown()
+        self._loop = None
+
+# Browser shared by every scrape of this process
+BROWSER_POOL = BrowserPool(SCRAPE_CONCURRENCY)
+
+async def _evaluate_job_fields(page: Page) -> dict:
+    """
+    Extracts the raw text of every job field from an already loaded job page
+    with a single page.evaluate call.
+    """
+    return await page.evaluate(_JOB_FIELDS_JS, JOB_FIELD_SELECTORS)
+
+def _job_details(description: str | None) -> dict:
+    """
+    Returns the job description with the relevant skills it mentions.
+    """
+    job_details = {"description": description, "skills": []}
+
+    # Extract skills from description
+    if description:
+        found_skills = {_SKILL_NAMES[match.lower()] for match in SKILL_RE.findall(description)}
+        job_details["skills"] = list(found_skills)
+
+    return job_details
+
+def _parse_publication_date(date_text: str | None) -> str | None:
+    """
+    Parses a publication date into 'YYYY-MM-DD' format.
+    ISO dates (e.g. a <time datetime> attribute) are read directly, other dates are matched
+    against _DATE_RE in one call. Text that is not a complete date of a known format is rejected.
     """
-    browser = None
+    if date_text:
+        date_text = date_text.strip()
+        # Attempt to parse the date
+        try:
+            iso_match = _ISO_DATE_RE.match(date_text)
+            if iso_match:
+                return datetime.date.fromisoformat(iso_match.group(1)).isoformat()
+
+            match = _DATE_RE.fullmatch(date_text)
+            if match:
+                # Only the groups of the matching alternative are set
+                parts = {name.split('_')[0]: value for name, value in match.groupdict().items() if value}
+                month = _MONTHS.get(parts['name'].lower()) if 'name' in parts else int(parts['month'])
+                if month is None:
+                    raise ValueError(f"unknown month name '{parts['name']}'")
+                return datetime.date(int(parts['year']), month, int(parts['day'])).isoformat()
+            print(f"Could not parse date '{date_text}': unknown format")
+        except ValueError as parse_e:
+            print(f"Could not parse date '{date_text}': {parse_e}")
+
+    return None # No date found or parsed
+
+def _normalize_job_url(url: str) -> str:
+    """
+    Drops the fragment and tracking parameters of a job URL, so that the same job
+    linked from several results pages (or with different tracking) is only scraped once.
+    Fragments used for routing by single-page apps ('#/...' or '#!...') identify the job and are kept.
+    """
+    parts = urlsplit(url)
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not (key.lower() in _TRACKING_PARAMS or key.lower().startswith("utm_"))
+    ]
+    fragment = parts.fragment if parts.fragment.startswith(('/', '!')) else ''
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), fragment))
+
+def _absolute_link(page_url: str, href: str | None) -> str | None:
+    """
+    Makes a link found on a page absolute.
+    """
+    if not href:
+        return None  # No application link found
+    return href if href.startswith("http") else page_url + href
+
+async def _extract_job_title(page: Page) -> str | None:
+    """
+    Extracts the job title from an already loaded job page.
+    """
+    return (await _evaluate_job_fields(page))["title"]
+
+async def _extract_job_details(page: Page) -> dict:
+    """
+    Extracts the job description and relevant skills from an already loaded job page.
+    """
+    return _job_details((await _evaluate_job_fields(page))["description"])
+
+async def _extract_publication_date(page: Page) -> str | None:
+    """
+    Extracts the publication date from an already loaded job page, as 'YYYY-MM-DD'.
+    """
+    return _parse_publication_date((await _evaluate_job_fields(page))["date"])
+
+async def _extract_company_and_location(page: Page) -> dict:
+    """
+    Extracts the company name and job location from an already loaded job page.
+    """
+    fields = await _evaluate_job_fields(page)
+    return {"company_name": fields["company_name"], "location": fields["location"]}
+
+async def _extract_application_link(page: Page) -> str | None:
+    """
+    Extracts the direct application link (or else a company careers link) from an already loaded job page.
+    """
+    return _absolute_link(page.url, (await _evaluate_job_fields(page))["application_link"])
+
+async def _scrape_with_page(url: str, page: Page | None, extract, description: str):
+    """
+    Navigates to url and runs one extractor on the loaded page.
+    If a page object is provided, it uses the existing page; otherwise, it opens a new page in the shared browser.
+    """
+    context = None
     if page is None:
-        p = await async_playwright().start()
-        browser = await p.chromium.launch()
-        page = await browser.new_page()
-    
+        context = await BROWSER_POOL.acquire()
+        page = await context.new_page()
+
     try:
-        await page.goto(url)
-        # Attempt to find job title in an h1 tag
-        h1_title = await page.query_selector("h1")
-        if h1_title:
-            return await h1_title.text_content()
-
-        # Attempt to find job title in a div with class 'job-title'
-        div_title = await page.query_selector("div.job-title")
-        if div_title:
-            return await div_title.text_content()
-
-        return None  # No job title found
+        await page.goto(url, wait_until="domcontentloaded")
+        return await extract(page)
     except Exception as e:
-        print(f"Error scraping {url}: {e}")
+        print(f"Error scraping {description} from {url}: {e}")
         return None
     finally:
-        if browser: # Only close browser if it was launched in this function
-            await browser.close()
-            await p.stop()
+        if context: # Only release the context if it was acquired in this function
+            await BROWSER_POOL.release(context)
+
+async def get_job_title(url: str, page: Page | None = None) -> str | None:
+    """
+    Navigates to a given URL using Playwright and extracts the job title.
+    Assumes the job title is within an <h1> tag or a <div> with class 'job-title'.
+    If a page object is provided, it uses the existing page; otherwise, it opens a new page in the shared browser.
+    """
+    return await _scrape_with_page(url, page, _extract_job_title, "job title")
 
 async def get_job_details(url: str, page: Page | None = None) -> dict | None:
     """
     Navigates to a given URL using Playwright and extracts the job description and relevant skills.
     Assumes the job description is within a <div> or <section> with class 'job-description' or 'description'.
-    If a page object is provided, it uses the existing page; otherwise, it launches a new browser and page.
+    If a page object is provided, it uses the existing page; otherwise, it opens a new page in the shared browser.
     """
-    browser = None
-    if page is None:
-        p = await async_playwright().start()
-        browser = await p.chromium.launch()
-        page = await browser.new_page()
-    
-    job_details = {"description": None, "skills": []}
-    try:
-        await page.goto(url)
-
-        # Extract job description
-        description_element = await page.query_selector("div.job-description, section.job-description, div.description, section.description")
-        if description_element:
-            job_details["description"] = await description_element.text_content()
-
-        # Extract skills from description
-        if job_details["description"]:
-            common_skills = ["Python", "SQL", "JavaScript", "AWS", "Docker", "Kubernetes", "React", "Angular", "Vue.js", "Node.js", "TypeScript", "Java", "C#", "Go", "Rust", "Azure", "GCP", "Terraform", "Ansible", "Git", "CI/CD", "Agile", "Scrum", "Linux", "Bash", "Data Science", "Machine Learning", "Deep Learning", "Pandas", "NumPy", "Scikit-learn", "TensorFlow", "PyTorch", "Spark", "Hadoop", "Kafka", "MongoDB", "PostgreSQL", "MySQL", "Redis", "GraphQL", "REST API", "Microservices", "Frontend", "Backend", "Fullstack", "DevOps", "Cloud", "Security", "Networking", "Blockchain", "AI", "NLP", "Computer Vision"]
-            found_skills = [skill for skill in common_skills if skill.lower() in job_details["description"].lower()]
-            job_details["skills"] = list(set(found_skills)) # Remove duplicates
-
-        return job_details
-    except Exception as e:
-        print(f"Error scraping job details from {url}: {e}")
-        return None
-    finally:
-        if browser: # Only close browser if it was launched in this function
-            await browser.close()
-            await p.stop()
-
-import datetime
+    return await _scrape_with_page(url, page, _extract_job_details, "job details")
 
 async def get_publication_date(url: str, page: Page | None = None) -> str | None:
     """
@@ -78,255 +458,203 @@ async def get_publication_date(url: str, page: Page | None = None) -> str | None
     Assumes the date is typically found within a <span>, <div>, or <p> tag
     with a specific class or attribute (e.g., 'date-posted', 'posted-on', 'job-date').
     Attempts to parse the date into 'YYYY-MM-DD' format.
-    If a page object is provided, it uses the existing page; otherwise, it launches a new browser and page.
+    If a page object is provided, it uses the existing page; otherwise, it opens a new page in the shared browser.
     """
-    browser = None
-    if page is None:
-        p = await async_playwright().start()
-        browser = await p.chromium.launch()
-        page = await browser.new_page()
-    
-    try:
-        await page.goto(url)
-        
-        # Common selectors for publication date
-        date_selectors = [
-            "span.date-posted", "div.date-posted", "p.date-posted",
-            "span.posted-on", "div.posted-on", "p.posted-on",
-            "span.job-date", "div.job-date", "p.job-date",
-            "[itemprop='datePosted']", # Schema.org common attribute
-            "time" # HTML5 time element
-        ]
-
-        date_text = None
-        for selector in date_selectors:
-            date_element = await page.query_selector(selector)
-            if date_element:
-                date_text = await date_element.text_content()
-                if date_text:
-                    break
-        
-        if date_text:
-            # Attempt to parse the date
-            try:
-                # Try common date formats
-                parsed_date = None
-                formats = [
-                    "%Y-%m-%d", "%B %d, %Y", "%b %d, %Y", "%d %B %Y", "%d %b %Y",
-                    "%Y/%m/%d", "%m/%d/%Y", "%d-%m-%Y"
-                ]
-                for fmt in formats:
-                    try:
-                        parsed_date = datetime.datetime.strptime(date_text.strip(), fmt)
-                        break
-                    except ValueError:
-                        continue
-                
-                if parsed_date:
-                    return parsed_date.strftime("%Y-%m-%d")
-            except Exception as parse_e:
-                print(f"Could not parse date '{date_text}': {parse_e}")
-        
-        return None # No date found or parsed
-    except Exception as e:
-        print(f"Error scraping publication date from {url}: {e}")
-        return None
-    finally:
-        if browser: # Only close browser if it was launched in this function
-            await browser.close()
-            await p.stop()
+    return await _scrape_with_page(url, page, _extract_publication_date, "publication date")
 
 async def get_company_and_location(url: str, page: Page | None = None) -> dict | None:
     """
     Navigates to a given URL using Playwright and extracts the company name and job location.
     Assumes company name is within a <span>, <div>, or <a> tag with common classes/attributes.
     Assumes location is within a <span>, <div>, or <p> tag with common classes/attributes.
-    If a page object is provided, it uses the existing page; otherwise, it launches a new browser and page.
+    If a page object is provided, it uses the existing page; otherwise, it opens a new page in the shared browser.
     """
-    browser = None
-    if page is None:
-        p = await async_playwright().start()
-        browser = await p.chromium.launch()
-        page = await browser.new_page()
-    
-    company_info = {"company_name": None, "location": None}
-    try:
-        await page.goto(url)
-
-        # Common selectors for company name
-        company_selectors = [
-            "span.company-name", "div.company-name", "a.company-name",
-            "span.employer", "div.employer", "a.employer",
-            "span.hiring-company", "div.hiring-company", "a.hiring-company",
-            "[data-testid='company-name']", # Common attribute in some job boards
-            "a[href*='company']" # Link to company profile
-        ]
-
-        for selector in company_selectors:
-            company_element = await page.query_selector(selector)
-            if company_element:
-                company_info["company_name"] = await company_element.text_content()
-                if company_info["company_name"]:
-                    break
-        
-        # Common selectors for location
-        location_selectors = [
-            "span.job-location", "div.job-location", "p.job-location",
-            "span.location", "div.location", "p.location",
-            "span.address", "div.address", "p.address",
-            "[data-testid='job-location']", # Common attribute in some job boards
-        ]
-
-        for selector in location_selectors:
-            location_element = await page.query_selector(selector)
-            if location_element:
-                company_info["location"] = await location_element.text_content()
-                if company_info["location"]:
-                    break
-
-        return company_info
-    except Exception as e:
-        print(f"Error scraping company and location from {url}: {e}")
-        return None
-    finally:
-        if browser: # Only close browser if it was launched in this function
-            await browser.close()
-            await p.stop()
-
+    return await _scrape_with_page(url, page, _extract_company_and_location, "company and location")
 
 async def get_application_link(url: str, page: Page | None = None) -> str | None:
     """
     Navigates to a given URL using Playwright and extracts the direct application link.
     Looks for specific text in <a> tags or specific classes/IDs.
     If a direct link is not found, it tries to find a link leading to the company's application page.
-    If a page object is provided, it uses the existing page; otherwise, it launches a new browser and page.
+    If a page object is provided, it uses the existing page; otherwise, it opens a new page in the shared browser.
     """
-    browser = None
-    if page is None:
-        p = await async_playwright().start()
-        browser = await p.chromium.launch()
-        page = await browser.new_page()
-    
-    try:
-        await page.goto(url)
+    return await _scrape_with_page(url, page, _extract_application_link, "application link")
 
-        # Common selectors and text for direct application links
-        apply_selectors = [
-            "a.apply-button", "a.application-link",
-            "a:has-text('Apply Now')", "a:has-text('Postuler')", "a:has-text('Candidater')",
-            "a[href*='apply']", "a[href*='application']"
-        ]
+async def scrape_job_page(url: str, page: Page) -> dict:
+    """
+    Navigates to a job page once and extracts all its fields from the loaded DOM:
+    title, description, skills, publication date, company, location and application link.
+    """
+    await page.goto(url, wait_until="domcontentloaded")
 
-        for selector in apply_selectors:
-            link_element = await page.query_selector(selector)
-            if link_element:
-                href = await link_element.get_attribute("href")
-                if href:
-                    return href if href.startswith("http") else page.url + href
-        
-        # If no direct link, try to find a link to the company's application page
-        company_apply_selectors = [
-            "a[href*='careers']", "a[href*='jobs']", "a[href*='hiring']"
-        ]
+    fields = await _evaluate_job_fields(page)
 
-        for selector in company_apply_selectors:
-            link_element = await page.query_selector(selector)
-            if link_element:
-                href = await link_element.get_attribute("href")
-                if href:
-                    return href if href.startswith("http") else page.url + href
+    job_data = {"url": url, "title": fields["title"]}
+    job_data.update(_job_details(fields["description"]))
+    job_data["publication_date"] = _parse_publication_date(fields["date"])
+    job_data["company_name"] = fields["company_name"]
+    job_data["location"] = fields["location"]
+    job_data["application_link"] = _absolute_link(page.url, fields["application_link"])
+    return job_data
 
-        return None  # No application link found
-    except Exception as e:
-        print(f"Error scraping application link from {url}: {e}")
-        return None
-    finally:
-        if browser: # Only close browser if it was launched in this function
-            await browser.close()
-            await p.stop()
+async def _scrape_job(job_url: str) -> dict:
+    """
+    Scrapes the details of one job in its own browser context, so several jobs
+    can be scraped concurrently. At most SCRAPE_CONCURRENCY contexts are in use at once.
+    """
+    async with BROWSER_POOL.context() as context:
+        print(f"Scraping details for: {job_url}")
+        page = await context.new_page()
+        return await scrape_job_page(job_url, page)
 
+def _paginated_search_urls(search_url: str, max_pages: int) -> list[str] | None:
+    """
+    Builds the URLs of the first max_pages results pages when the search URL carries its
+    page number as a query parameter (e.g. ?page=1), or returns None when it doesn't.
+    """
+    parts = urlsplit(search_url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    for index, (key, value) in enumerate(query):
+        if key.lower() in _PAGE_NUMBER_PARAMS and value.isdigit():
+            first_page = int(value)
+            page_urls = []
+            for page_number in range(first_page, first_page + max_pages):
+                query[index] = (key, str(page_number))
+                page_urls.append(urlunsplit(parts._replace(query=urlencode(query))))
+            return page_urls
+    return None
+
+async def _find_job_urls(page: Page) -> list[str]:
+    """
+    Extracts the individual job posting URLs of an already loaded search results page.
+    """
+    # The hrefs are read in the page in one call; a.href is already resolved to an absolute URL
+    hrefs = await page.eval_on_selector_all(JOB_LINK_SELECTOR, "links => links.map(a => a.href).filter(Boolean)")
+    job_urls = [_normalize_job_url(href) for href in hrefs]
+    return job_urls
+
+async def _wait_for_results(page: Page, previous_first_link: str | None = None):
+    """
+    Waits until a search results page's DOM is parsed and its job links are attached,
+    rather than for the whole network (trackers, long polling) to go idle.
+    previous_first_link is the first job link of the page shown before: after a click to the
+    next page, its links stay attached until they are replaced, and must not be read again.
+    """
+    await page.wait_for_load_state("domcontentloaded")
+    try:
+        if previous_first_link:
+            await page.wait_for_function(
+                "([selector, previous]) => document.querySelector(selector)?.href !== previous",
+                arg=[JOB_LINK_SELECTOR, previous_first_link],
+                timeout=RESULTS_TIMEOUT_MS
+            )
+        await page.wait_for_selector(JOB_LINK_SELECTOR, state="attached", timeout=RESULTS_TIMEOUT_MS)
+    except PlaywrightTimeoutError:
+        pass # No job links on this page; _find_job_urls will find none
+
+async def _scrape_search_page(page_url: str) -> list[str]:
+    """
+    Loads one search results page in its own browser context and returns its job URLs.
+    """
+    async with BROWSER_POOL.context() as context:
+        print(f"Scraping results page: {page_url}")
+        page = await context.new_page()
+        await page.goto(page_url, wait_until="domcontentloaded")
+        await _wait_for_results(page)
+        return await _find_job_urls(page)
+
+async def _scrape_jobs(job_urls: list[str]) -> list[dict]:
+    """
+    Scrapes the details of several jobs concurrently. Jobs that fail are reported and skipped.
+    """
+    results = await asyncio.gather(
+        *[_scrape_job(job_url) for job_url in job_urls],
+        return_exceptions=True
+    )
+    job_data = []
+    for job_url, result in zip(job_urls, results):
+        if isinstance(result, Exception):
+            print(f"Error scraping details for {job_url}: {result}")
+        else:
+            job_data.append(result)
+    return job_data
 
 async def scrape_jobs_from_search_page(search_url: str, max_pages: int = 5) -> list[dict]:
     """
     Navigates through multiple pages of job search results, extracts individual job URLs,
-    and then scrapes details for each job.
+    and then scrapes details for each job. The jobs of a results page are scraped concurrently.
+    When the search URL has a page number parameter, the results pages are loaded concurrently
+    too; otherwise the "next page" button is followed one page at a time.
+    A job listed on several results pages is only scraped the first time it is found.
     """
     all_job_data = []
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        page: Page = await browser.new_page()
-        try:
-            await page.goto(search_url)
-            print(f"Navigated to search URL: {search_url}")
-
-            for i in range(max_pages):
-                print(f"Scraping page {i + 1} of {max_pages}...")
-                await page.wait_for_load_state("networkidle")
-
-                # Extract individual job posting URLs
-                # Common selectors for job links on a search results page
-                job_link_selectors = [
-                    "a.job-card-link", "a.job-listing-link", "a[data-testid='job-result']",
-                    "div.job-result-card a", "li.job-item a"
-                ]
-                
-                job_urls = []
-                for selector in job_link_selectors:
-                    elements = await page.query_selector_all(selector)
-                    for element in elements:
-                        href = await element.get_attribute("href")
-                        if href:
-                            # Ensure the URL is absolute
-                            if not href.startswith("http"):
-                                href = page.url.split('/')[0] + '//' + page.url.split('/')[2] + href
-                            job_urls.append(href)
-                    if job_urls: # If we found links with one selector, we can stop
-                        break
-                
-                job_urls = list(set(job_urls)) # Remove duplicates
-                print(f"Found {len(job_urls)} job URLs on page {i + 1}.")
-
-                for job_url in job_urls:
-                    print(f"Scraping details for: {job_url}")
-                    job_data = {"url": job_url}
-                    
-                    # Pass the existing page object to avoid re-launching browser for each job
-                    job_data["title"] = await get_job_title(job_url, page)
-                    details = await get_job_details(job_url, page)
-                    if details:
-                        job_data.update(details)
-                    job_data["publication_date"] = await get_publication_date(job_url, page)
-                    company_location = await get_company_and_location(job_url, page)
-                    if company_location:
-                        job_data.update(company_location)
-                    job_data["application_link"] = await get_application_link(job_url, page)
-                    
-                    all_job_data.append(job_data)
-                
-                # Locate and click the "next page" button
-                next_page_selectors = [
-                    "a.next-page", "button.pagination-next", "a[aria-label='Next']",
-                    "a:has-text('Next')", "a:has-text('Suivant')"
-                ]
-                
-                next_button = None
-                for selector in next_page_selectors:
-                    next_button = await page.query_selector(selector)
-                    if next_button:
-                        break
-                
-                if next_button and not await next_button.is_disabled():
-                    print("Clicking next page button...")
-                    await next_button.click()
-                    await page.wait_for_load_state("networkidle")
+    seen_urls = set()
+
+    def new_job_urls(job_urls: list[str], page_number: int) -> list[str]:
+        # Remove duplicates, within this page and with the previous pages
+        job_urls = list(dict.fromkeys(url for url in job_urls if url not in seen_urls))
+        seen_urls.update(job_urls)
+        print(f"Found {len(job_urls)} new job URLs on page {page_number}.")
+        return job_urls
+
+    try:
+        page_urls = _paginated_search_urls(search_url, max_pages)
+        if page_urls:
+            print(f"Scraping {len(page_urls)} results pages of {search_url} concurrently...")
+            results = await asyncio.gather(
+                *[_scrape_search_page(page_url) for page_url in page_urls],
+                return_exceptions=True
+            )
+            job_urls = []
+            for i, (page_url, result) in enumerate(zip(page_urls, results)):
+                if isinstance(result, Exception):
+                    print(f"Error scraping results page {page_url}: {result}")
                 else:
-                    print("Next page button not found or disabled. End of results.")
-                    break # No more pages or button is disabled
+                    job_urls.extend(new_job_urls(result, i + 1))
+            all_job_data.extend(await _scrape_jobs(job_urls))
+        else:
+            # The search page gets its own context, outside the pool, so that all the pool's
+            # slots stay available to the jobs scraped while it is open
+            context = await _new_context(await BROWSER_POOL.get_browser())
+            try:
+                page: Page = await context.new_page()
+                await page.goto(search_url, wait_until="domcontentloaded")
+                print(f"Navigated to search URL: {search_url}")
+
+                previous_first_link = None
+                for i in range(max_pages):
+                    print(f"Scraping page {i + 1} of {max_pages}...")
+                    await _wait_for_results(page, previous_first_link)
+
+                    # Extract individual job posting URLs
+                    job_urls = new_job_urls(await _find_job_urls(page), i + 1)
+
+                    # The search page stays on the results while the jobs are scraped in their own contexts
+                    all_job_data.extend(await _scrape_jobs(job_urls))
+
+                    # Locate the "next page" button, then check the state of that same element
+                    next_button = (await page.evaluate_handle(_NEXT_PAGE_JS, NEXT_PAGE_SELECTORS)).as_element()
+                    next_page = await next_button.evaluate(_NEXT_PAGE_STATE_JS) if next_button else None
+
+                    if next_page and not next_page["disabled"]:
+                        previous_first_link = await page.evaluate(
+                            "selector => document.querySelector(selector)?.href ?? null", JOB_LINK_SELECTOR
+                        )
+                        if next_page["href"]:
+                            print(f"Going to next page: {next_page['href']}")
+                            await page.goto(next_page["href"], wait_until="domcontentloaded")
+                        else:
+                            print("Clicking next page button...")
+                            await next_button.click()
+                        # _wait_for_results waits for the next page at the top of the loop
+                    else:
+                        print("Next page button not found or disabled. End of results.")
+                        break # No more pages or button is disabled
+            finally:
+                await context.close()
 
-        except Exception as e:
-            print(f"Error during pagination scraping from {search_url}: {e}")
-        finally:
-            await browser.close()
+    except Exception as e:
+        print(f"Error during pagination scraping from {search_url}: {e}")
     return all_job_data
 
 
@@ -385,4 +713,6 @@ if __name__ == "__main__":
             for key, value in job.items():
                 print(f"  {key}: {value}")
 
+        await BROWSER_POOL.close()
+
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,57 @@
+import re
+import unittest
+
+from ai_matcher import _overlaps_profile
+
+PROFILE = "Python developer with experience in Django, REST APIs, PostgreSQL and machine learning."
+
+# A realistic long posting: a relevant role buried in company, benefits and process boilerplate
+LONG_DESCRIPTION = " ".join([
+    "About us: we are a fast growing fintech company headquartered in Paris with offices in Lyon,",
+    "Bordeaux, Lisbon and Montreal, serving more than two million customers across Europe and Canada.",
+    "Our mission is to make everyday banking simple, transparent and affordable for households and",
+    "small businesses alike, and we are backed by leading investors who share our long term vision.",
+    "The role: you will join the platform team to design, build and maintain the Python services",
+    "behind our payment and onboarding flows, exposed to our mobile and web applications.",
+    "You will collaborate with product managers,",
+    "designers, data scientists and compliance officers, take part in code reviews, on-call rotations",
+    "and architecture discussions, and help us industrialize machine learning models for fraud detection.",
+    "Benefits: hybrid remote policy, meal vouchers, public transport reimbursement, private health",
+    "insurance, yearly training budget, team offsites, parental leave beyond the legal minimum, stock",
+    "options and a brand new office with a rooftop terrace, gym access and weekly breakfast.",
+    "Hiring process: a first call with our talent acquisition partner, a technical interview with two",
+    "engineers, a take home exercise reviewed together, and a final meeting with the head of engineering.",
+    "We are committed to diversity and inclusion and welcome applications from all backgrounds.",
+    "Candidates should be fluent in French, comfortable presenting to stakeholders, curious about",
+    "consumer finance regulation, and eager to mentor junior colleagues while growing their own career.",
+    "Start date: as soon as possible. Salary range shared during the first call, depending on seniority.",
+])
+
+UNRELATED_DESCRIPTION = "Seeking a marketing specialist for digital campaigns and social media management."
+
+# A few of the English stop words removed by ai_matcher's vectorizer
+STOP_WORDS = {"a", "about", "all", "and", "are", "as", "by", "for", "from", "in", "is", "of",
+              "our", "than", "the", "their", "them", "through", "to", "two", "us", "we", "who", "will",
+              "with", "you", "more", "part", "together", "first", "beyond", "behind", "should", "own", "while"}
+
+def _tokens(text):
+    # Same token pattern as ai_matcher's vectorizer
+    return set(re.findall(r"\b[a-z]{2,}\b", text.lower())) - STOP_WORDS
+
+class OverlapPrefilterTest(unittest.TestCase):
+
+    def test_long_relevant_description_passes(self):
+        user_tokens, job_tokens = _tokens(PROFILE), _tokens(LONG_DESCRIPTION)
+        # Its Jaccard index against the short profile is below the 0.02 Jaccard cut-off used before
+        jaccard = len(user_tokens & job_tokens) / len(user_tokens | job_tokens)
+        self.assertLess(jaccard, 0.02)
+        self.assertTrue(_overlaps_profile(user_tokens, job_tokens))
+
+    def test_unrelated_description_is_skipped(self):
+        self.assertFalse(_overlaps_profile(_tokens(PROFILE), _tokens(UNRELATED_DESCRIPTION)))
+
+    def test_empty_profile_is_skipped(self):
+        self.assertFalse(_overlaps_profile(set(), _tokens(LONG_DESCRIPTION)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from filter_jobs import filter_jobs
+
+# Rows shaped like the ones scraper.scrape_jobs produces: 'skills' is a list
+SCRAPED_JOBS = [
+    {
+        'title': 'Backend Developer',
+        'location': 'Paris, France',
+        'job_duration': None,
+        'description': 'Build APIs in Python with Django. Team language: English.',
+        'skills': ['Python', 'Django'],
+    },
+    {
+        'title': 'Frontend Developer',
+        'location': 'Remote',
+        'job_duration': None,
+        'description': 'React single page apps.',
+        'skills': ['JavaScript', 'React'],
+    },
+    {
+        'title': 'Data Analyst',
+        'location': 'Lyon, France',
+        'job_duration': None,
+        'description': None,
+        'skills': [],
+    },
+]
+
+class FilterJobsTest(unittest.TestCase):
+
+    def test_keywords_match_list_skills(self):
+        jobs = filter_jobs(SCRAPED_JOBS, {'technologies_keywords': ['react']})
+        self.assertEqual([job['title'] for job in jobs], ['Frontend Developer'])
+
+    def test_languages_match_description_and_list_skills(self):
+        jobs = filter_jobs(SCRAPED_JOBS, {
+            'technologies_keywords': ['Python'],
+            'preferred_languages': ['English'],
+        })
+        self.assertEqual([job['title'] for job in jobs], ['Backend Developer'])
+
+    def test_location_and_missing_fields(self):
+        jobs = filter_jobs(SCRAPED_JOBS, {'location_preferences': ['France'], 'job_duration': 'Full-time'})
+        self.assertEqual(jobs, [])
+        jobs = filter_jobs(SCRAPED_JOBS, {'location_preferences': ['France']})
+        self.assertEqual([job['title'] for job in jobs], ['Backend Developer', 'Data Analyst'])
+
+if __name__ == '__main__':
+    unittest.main()